@@ -1,11 +1,10 @@
 """
 Alchemy Engine - Semantic element combination system.
+
+Submodule attributes are resolved lazily (PEP 562) so that importing the
+package — e.g. to reach the CLI — doesn't pull in heavy dependencies like
+requests or the SVG generator until they are actually used.
 """
-from .models import Element
-from .database import AlchemyDatabase
-from .generator import ElementGenerator, GenerationError
-from .engine import AlchemyEngine
-from .seed_data import get_base_elements, initialize_base_elements
 
 __all__ = [
     'Element',
@@ -16,3 +15,24 @@ __all__ = [
     'get_base_elements',
     'initialize_base_elements',
 ]
+
+_ATTR_MODULES = {
+    'Element': 'models',
+    'AlchemyDatabase': 'database',
+    'ElementGenerator': 'generator',
+    'GenerationError': 'generator',
+    'AlchemyEngine': 'engine',
+    'get_base_elements': 'seed_data',
+    'initialize_base_elements': 'seed_data',
+}
+
+
+def __getattr__(name):
+    module_name = _ATTR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    module = import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,16 @@
 """
 Command-line interface for the Alchemy Laboratory.
 """
+from __future__ import annotations
+
 import sys
-from .database import AlchemyDatabase
-from .generator import ElementGenerator, GenerationError
-from .engine import AlchemyEngine
-from .seed_data import initialize_base_elements
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import AlchemyEngine
+
+# Heavy modules (requests, spell circle generator, ...) are imported
+# inside main() so `python main.py --help`-style startup stays fast.
 
 
 class AlchemyCLI:
@@ -15,6 +20,19 @@ class AlchemyCLI:
         """Initialize the CLI with an alchemy engine."""
         self.engine = engine
 
+        # O(1) command dispatch instead of an if/elif chain
+        self._commands = {
+            "quit": self._cmd_quit,
+            "exit": self._cmd_quit,
+            "q": self._cmd_quit,
+            "help": self._cmd_help,
+            "list": self._cmd_list,
+            "combine": self._cmd_combine,
+            "show": self._cmd_show,
+            "lineage": self._cmd_lineage,
+            "stats": self._cmd_stats,
+        }
+
     def run(self):
         """Run the main CLI loop."""
         self.print_welcome()
@@ -64,50 +82,54 @@ class AlchemyCLI:
         parts = command.split()
         cmd = parts[0].lower()
 
-        if cmd in ["quit", "exit", "q"]:
-            print("\nGoodbye!")
-            sys.exit(0)
+        handler = self._commands.get(cmd)
+        if handler is None:
+            print(f"Unknown command: {cmd}")
+            print("Type 'help' for available commands")
+            return
 
-        elif cmd == "help":
-            self.print_welcome()
+        handler(parts)
 
-        elif cmd == "list":
-            self.list_elements()
+    def _cmd_quit(self, parts: list[str]):
+        print("\nGoodbye!")
+        sys.exit(0)
 
-        elif cmd == "combine":
-            if len(parts) < 3:
-                print("Usage: combine <element_a> <element_b>")
-                print("Example: combine Fire Water")
-                print("Example: combine 1 2")
-                return
-            self.combine_elements(parts[1], parts[2])
+    def _cmd_help(self, parts: list[str]):
+        self.print_welcome()
 
-        elif cmd == "show":
-            if len(parts) < 2:
-                print("Usage: show <element_name or number>")
-                print("Example: show Fire")
-                print("Example: show 1")
-                return
-            self.show_element(" ".join(parts[1:]))
+    def _cmd_list(self, parts: list[str]):
+        self.list_elements()
 
-        elif cmd == "lineage":
-            if len(parts) < 2:
-                print("Usage: lineage <element_name or number>")
-                return
-            self.show_lineage(" ".join(parts[1:]))
+    def _cmd_combine(self, parts: list[str]):
+        if len(parts) < 3:
+            print("Usage: combine <element_a> <element_b>")
+            print("Example: combine Fire Water")
+            print("Example: combine 1 2")
+            return
+        self.combine_elements(parts[1], parts[2])
 
-        elif cmd == "stats":
-            self.show_stats()
+    def _cmd_show(self, parts: list[str]):
+        if len(parts) < 2:
+            print("Usage: show <element_name or number>")
+            print("Example: show Fire")
+            print("Example: show 1")
+            return
+        self.show_element(" ".join(parts[1:]))
 
-        else:
-            print(f"Unknown command: {cmd}")
-            print("Type 'help' for available commands")
+    def _cmd_lineage(self, parts: list[str]):
+        if len(parts) < 2:
+            print("Usage: lineage <element_name or number>")
+            return
+        self.show_lineage(" ".join(parts[1:]))
+
+    def _cmd_stats(self, parts: list[str]):
+        self.show_stats()
 
     def list_elements(self):
         """List all available elements."""
-        elements = self.engine.list_all_elements()
+        rows = self.engine.list_all_with_parent_names()
 
-        if not elements:
+        if not rows:
             print("\nNo elements found. Something went wrong!")
             return
 
@@ -115,32 +137,34 @@ class AlchemyCLI:
         print("AVAILABLE ELEMENTS")
         print("="*70)
 
-        # Separate base and combined elements
-        base_elements = [e for e in elements if e.is_base]
-        combined_elements = [e for e in elements if not e.is_base]
+        # Partition into base and combined in a single pass
+        base_elements = []
+        combined_elements = []
+        for row in rows:
+            (base_elements if row[0].is_base else combined_elements).append(row)
 
         print("\nBase Elements:")
-        for i, element in enumerate(base_elements, 1):
+        for i, (element, _, _) in enumerate(base_elements, 1):
             print(f"  {i}. {element.name}")
 
         if combined_elements:
             print(f"\nDiscovered Combinations ({len(combined_elements)}):")
             start_idx = len(base_elements) + 1
-            for i, element in enumerate(combined_elements, start_idx):
-                # Get parent names
-                if element.parent_a and element.parent_b:
-                    parent_a = self.engine.get_element_by_id(element.parent_a)
-                    parent_b = self.engine.get_element_by_id(element.parent_b)
-                    parent_info = f" ({parent_a.name} + {parent_b.name})"
+            for i, (element, parent_a_name, parent_b_name) in enumerate(combined_elements, start_idx):
+                # Parent names come pre-resolved from the single query
+                if parent_a_name and parent_b_name:
+                    parent_info = f" ({parent_a_name} + {parent_b_name})"
                 else:
                     parent_info = ""
                 print(f"  {i}. {element.name}{parent_info}")
 
         print("="*70)
-        print(f"\nTotal: {len(elements)} elements")
+        print(f"\nTotal: {len(rows)} elements")
 
     def combine_elements(self, a: str, b: str):
         """Combine two elements."""
+        from .generator import GenerationError
+
         try:
             # Try to parse as numbers first
             element_a = self._get_element(a)
@@ -150,7 +174,7 @@ class AlchemyCLI:
                 return
 
             # Perform combination
-            result = self.engine.combine(element_a, element_b, verbose=True)
+            result, _ = self.engine.combine(element_a, element_b, verbose=True)
 
             # Display result
             print(result.get_display_info())
@@ -223,6 +247,11 @@ class AlchemyCLI:
 
 def main():
     """Main entry point for the CLI."""
+    from .database import AlchemyDatabase
+    from .engine import AlchemyEngine
+    from .generator import ElementGenerator
+    from .seed_data import initialize_base_elements
+
     print("\nInitializing Alchemy Laboratory...")
 
     # Initialize database
@@ -250,7 +279,10 @@ def main():
 
     # Start CLI
     cli = AlchemyCLI(engine)
-    cli.run()
+    try:
+        cli.run()
+    finally:
+        db.close()
 
 
 if __name__ == "__main__":
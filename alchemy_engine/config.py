@@ -6,6 +6,12 @@ import os
 # Database settings
 DATABASE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'alchemy.db')
 
+# On-disk cache of raw LLM responses, keyed by prompt hash
+PROMPT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'prompt_cache.db')
+
+# On-disk cache of generated spell circle SVGs, keyed by element name hash
+SPELL_CIRCLE_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'spell_circles')
+
 # Ollama settings
 OLLAMA_BASE_URL = "http://localhost:11434"
 OLLAMA_MODEL = "llama3.2"  # Can be changed to other models like "mistral", "qwen2.5", etc.
@@ -4,12 +4,91 @@ Uses SQLite for local, deterministic storage.
 """
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from typing import Optional, List
+
+try:
+    # C-implemented JSON is ~3-5x faster at decoding the tags/hints/
+    # properties columns, which is the hot CPU cost of list/show
+    import orjson
+
+    def _json_loads(s):
+        return orjson.loads(s)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - fallback when orjson is absent
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 from .models import Element
 from .config import DATABASE_PATH
+from datetime import datetime
 import os
 
 
+def _created_at_value(raw) -> float:
+    """
+    Read a stored creation time, accepting legacy ISO-string rows.
+
+    _init_db migrates those rows to epoch floats, so this is a
+    read-time safety net rather than a load-bearing branch.
+    """
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(raw).timestamp()
+
+
+# Explicit column list for every element read: keeps positional decoding
+# honest if the schema grows, and lets SQLite serve name-only lookups from
+# covering indices instead of materializing whole rows.
+_ELEMENT_COLS = (
+    "id, name, description, tags, visual_hint, behavior_hints, "
+    "is_base, parent_a, parent_b, combination_order, created_at, properties"
+)
+
+_ELEMENT_COLS_E = ", ".join(f"e.{c.strip()}" for c in _ELEMENT_COLS.split(","))
+
+# Hot queries live in module constants: sqlite3 caches prepared statements
+# per connection keyed by the exact SQL string, so reusing one string
+# object skips re-parsing and re-planning on every call.
+_GET_COMBO_SQL = f"""
+    SELECT {_ELEMENT_COLS_E} FROM elements e
+    JOIN combinations c ON e.id = c.result_id
+    WHERE c.combo_key = ?
+"""
+
+_ALL_WITH_PARENTS_SQL = f"""
+    SELECT {_ELEMENT_COLS_E}, pa.name AS parent_a_name, pb.name AS parent_b_name
+    FROM elements e
+    LEFT JOIN elements pa ON pa.id = e.parent_a
+    LEFT JOIN elements pb ON pb.id = e.parent_b
+    ORDER BY e.created_at ASC
+"""
+
+# created_at is REAL (epoch seconds): floats round-trip exactly and
+# ORDER BY created_at compares numerically. A TEXT column would store
+# floats as %.15g strings — losing precision and sorting new rows
+# lexicographically before legacy ISO-dated ones.
+_CREATE_ELEMENTS_SQL = """
+    CREATE TABLE IF NOT EXISTS elements (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT,
+        tags TEXT,
+        visual_hint TEXT,
+        behavior_hints TEXT,
+        is_base BOOLEAN,
+        parent_a TEXT,
+        parent_b TEXT,
+        combination_order TEXT,
+        created_at REAL,
+        properties TEXT
+    )
+"""
+
+
 class AlchemyDatabase:
     """Handles all database operations for the alchemy engine."""
 
@@ -20,49 +99,213 @@ class AlchemyDatabase:
         # Ensure data directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
+        # Single long-lived connection, shared across all methods.
+        # Opening a fresh connection per call pays connect + page-cache
+        # warmup costs every time; reusing one amortizes that away.
+        self.conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=256
+        )
+        self.conn.row_factory = sqlite3.Row
+
+        # In-process memo of elements by id/name. Lineage walks hit the
+        # same ancestors repeatedly (shared parents form a DAG); caching
+        # turns those repeat fetches into dict lookups.
+        self._id_cache: dict[str, Element] = {}
+        self._name_cache: dict[str, Element] = {}
+
+        # Serializes writers on the shared connection. The API runs
+        # the sync layer on worker threads (asyncio.to_thread), and
+        # two overlapping BEGIN IMMEDIATE transactions on one
+        # connection fail with "cannot start a transaction within a
+        # transaction" — with the second thread's rollback killing the
+        # first thread's in-flight writes. Plain statements are safe
+        # without it (the sqlite3 module serializes individual calls);
+        # only multi-statement write transactions need the lock.
+        self._write_lock = threading.Lock()
+
+        # Monotonic write counter; callers can cache derived views (e.g.
+        # the full element list) and invalidate when this changes
+        self.version = 0
+
         # Initialize database
         self._init_db()
 
     def _init_db(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cursor = self.conn.cursor()
+
+        # WAL lets readers proceed while a combine is being written, and
+        # synchronous=NORMAL halves the fsync cost per transaction
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+
+        # Keep temporary structures and a generous page cache in memory
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+
+        # Elements table
+        cursor.execute(_CREATE_ELEMENTS_SQL)
+
+        # Combinations table for deterministic caching
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS combinations (
+                combo_key TEXT PRIMARY KEY,
+                result_id TEXT,
+                created_at TEXT,
+                FOREIGN KEY (result_id) REFERENCES elements (id)
+            )
+        """)
+
+        # Databases created before created_at became REAL keep TEXT
+        # affinity through CREATE IF NOT EXISTS; rebuild them once
+        cursor.execute("PRAGMA table_info(elements)")
+        created_at_type = next(
+            row["type"] for row in cursor.fetchall() if row["name"] == "created_at"
+        )
+        if created_at_type.upper() != "REAL":
+            self._migrate_created_at_to_real(cursor)
+
+        # Indices for the name-lookup and base-filter paths; without these
+        # every `show <name>` / `list` does a full table scan
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_elements_name ON elements(name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_elements_is_base ON elements(is_base)")
+
+        self.conn.commit()
+
+    def _migrate_created_at_to_real(self, cursor) -> None:
+        """
+        Rebuild the elements table with created_at as REAL, converting
+        legacy ISO-string (and float-as-text) values to epoch floats.
+
+        SQLite can't change a column's affinity in place, so this
+        renames the old table, recreates it with the current schema,
+        and copies the rows across with created_at decoded in Python.
+        The old table's indices die with it and _init_db recreates
+        them right after.
+        """
+        cursor.execute("ALTER TABLE elements RENAME TO elements_legacy")
+        cursor.execute(_CREATE_ELEMENTS_SQL)
+
+        cursor.execute(f"SELECT {_ELEMENT_COLS} FROM elements_legacy")
+        rows = [
+            tuple(row)[:10] + (_created_at_value(row["created_at"]), row["properties"])
+            for row in cursor.fetchall()
+        ]
+        cursor.executemany(f"""
+            INSERT INTO elements ({_ELEMENT_COLS})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+        cursor.execute("DROP TABLE elements_legacy")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into one explicit transaction.
+
+        Yields a cursor; the commit (and its fsync) happens once on
+        exit, with a rollback if the block raises. BEGIN IMMEDIATE
+        takes the database write lock up front so the batch can't
+        stall midway behind another writer, and _write_lock keeps
+        concurrent threads from ever nesting transactions on the
+        shared connection — which also means the rollback below can
+        only ever target this thread's own transaction.
+        """
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def save_element(self, element: Element) -> None:
+        """Save an element to the database."""
+        with self._write_lock:
+            cursor = self.conn.cursor()
 
-            # Elements table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS elements (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    tags TEXT,
-                    visual_hint TEXT,
-                    behavior_hints TEXT,
-                    is_base BOOLEAN,
-                    parent_a TEXT,
-                    parent_b TEXT,
-                    combination_order TEXT,
-                    created_at TEXT,
-                    properties TEXT
-                )
-            """)
-
-            # Combinations table for deterministic caching
             cursor.execute("""
-                CREATE TABLE IF NOT EXISTS combinations (
-                    combo_key TEXT PRIMARY KEY,
-                    result_id TEXT,
-                    created_at TEXT,
-                    FOREIGN KEY (result_id) REFERENCES elements (id)
-                )
-            """)
+                INSERT OR REPLACE INTO elements
+                (id, name, description, tags, visual_hint, behavior_hints,
+                 is_base, parent_a, parent_b, combination_order, created_at, properties)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                element.id,
+                element.name,
+                element.description,
+                _json_dumps(element.tags),
+                element.visual_hint,
+                _json_dumps(element.behavior_hints),
+                element.is_base,
+                element.parent_a,
+                element.parent_b,
+                element.combination_order,
+                element.created_at,
+                _json_dumps(element.properties)
+            ))
 
-            conn.commit()
+            self.conn.commit()
 
-    def save_element(self, element: Element) -> None:
-        """Save an element to the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        self.version += 1
+        self._id_cache[element.id] = element
+        self._name_cache[element.name] = element
 
+    def save_elements_bulk(self, elements: List[Element]) -> None:
+        """
+        Save many elements in one transaction with a single prepared
+        statement (executemany) — one parse/plan and one commit instead
+        of one per row. Used for seeding.
+        """
+        rows = [
+            (
+                element.id,
+                element.name,
+                element.description,
+                _json_dumps(element.tags),
+                element.visual_hint,
+                _json_dumps(element.behavior_hints),
+                element.is_base,
+                element.parent_a,
+                element.parent_b,
+                element.combination_order,
+                element.created_at,
+                _json_dumps(element.properties)
+            )
+            for element in elements
+        ]
+
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO elements
+                (id, name, description, tags, visual_hint, behavior_hints,
+                 is_base, parent_a, parent_b, combination_order, created_at, properties)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            self.conn.commit()
+
+        self.version += 1
+        for element in elements:
+            self._id_cache[element.id] = element
+            self._name_cache[element.name] = element
+
+    def save_element_and_combination(
+        self,
+        element: Element,
+        combo_key: str,
+        created_at: str
+    ) -> None:
+        """
+        Save a newly discovered element and its combination mapping
+        in a single transaction (one fsync instead of two).
+        """
+        with self.transaction() as cursor:
             cursor.execute("""
                 INSERT OR REPLACE INTO elements
                 (id, name, description, tags, visual_hint, behavior_hints,
@@ -72,126 +315,185 @@ class AlchemyDatabase:
                 element.id,
                 element.name,
                 element.description,
-                json.dumps(element.tags),
+                _json_dumps(element.tags),
                 element.visual_hint,
-                json.dumps(element.behavior_hints),
+                _json_dumps(element.behavior_hints),
                 element.is_base,
                 element.parent_a,
                 element.parent_b,
                 element.combination_order,
                 element.created_at,
-                json.dumps(element.properties)
+                _json_dumps(element.properties)
             ))
+            cursor.execute("""
+                INSERT OR REPLACE INTO combinations (combo_key, result_id, created_at)
+                VALUES (?, ?, ?)
+            """, (combo_key, element.id, created_at))
 
-            conn.commit()
+        self.version += 1
+        self._id_cache[element.id] = element
+        self._name_cache[element.name] = element
 
     def get_element(self, element_id: str) -> Optional[Element]:
         """Retrieve an element by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cached = self._id_cache.get(element_id)
+        if cached is not None:
+            return cached
+
+        cursor = self.conn.cursor()
 
-            cursor.execute("SELECT * FROM elements WHERE id = ?", (element_id,))
-            row = cursor.fetchone()
+        cursor.execute(f"SELECT {_ELEMENT_COLS} FROM elements WHERE id = ?", (element_id,))
+        row = cursor.fetchone()
 
-            if row:
-                return self._row_to_element(row)
-            return None
+        if row:
+            element = self._row_to_element(row)
+            self._id_cache[element.id] = element
+            return element
+        return None
 
     def get_element_by_name(self, name: str) -> Optional[Element]:
         """Retrieve an element by name."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cached = self._name_cache.get(name)
+        if cached is not None:
+            return cached
 
-            cursor.execute("SELECT * FROM elements WHERE name = ?", (name,))
-            row = cursor.fetchone()
+        cursor = self.conn.cursor()
 
-            if row:
-                return self._row_to_element(row)
-            return None
+        cursor.execute(f"SELECT {_ELEMENT_COLS} FROM elements WHERE name = ?", (name,))
+        row = cursor.fetchone()
+
+        if row:
+            element = self._row_to_element(row)
+            self._name_cache[element.name] = element
+            return element
+        return None
 
     def get_all_elements(self) -> List[Element]:
         """Get all elements from the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cursor = self.conn.cursor()
+
+        cursor.execute(f"SELECT {_ELEMENT_COLS} FROM elements ORDER BY created_at ASC")
+        rows = cursor.fetchall()
+
+        return [self._row_to_element(row) for row in rows]
+
+    def get_all_with_parent_names(self) -> List[tuple[Element, Optional[str], Optional[str]]]:
+        """
+        Get all elements with their parents' names resolved by SQLite.
+
+        Self-joins on parent_a/parent_b so a display path that wants
+        '(Fire + Water)' annotations needs exactly one query instead of
+        two extra lookups per combined element.
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute(_ALL_WITH_PARENTS_SQL)
+
+        return [
+            (self._row_to_element(row), row["parent_a_name"], row["parent_b_name"])
+            for row in cursor.fetchall()
+        ]
+
+    def iter_all_elements(self):
+        """
+        Iterate all elements (with parent names) straight off the
+        cursor.
+
+        Same rows as get_all_with_parent_names, but yielded one at a
+        time so a streaming consumer never materializes the whole
+        catalog in memory.
+        """
+        cursor = self.conn.cursor()
 
-            cursor.execute("SELECT * FROM elements ORDER BY created_at ASC")
-            rows = cursor.fetchall()
+        cursor.execute(_ALL_WITH_PARENTS_SQL)
 
-            return [self._row_to_element(row) for row in rows]
+        for row in cursor:
+            yield self._row_to_element(row), row["parent_a_name"], row["parent_b_name"]
+
+    def has_base_elements(self) -> bool:
+        """
+        Check whether any base element exists.
+
+        SELECT 1 ... LIMIT 1 stops at the first index hit, so the
+        every-startup "already seeded?" path never materializes rows.
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute("SELECT 1 FROM elements WHERE is_base = 1 LIMIT 1")
+        return cursor.fetchone() is not None
 
     def get_base_elements(self) -> List[Element]:
         """Get only base elements."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cursor = self.conn.cursor()
 
-            cursor.execute("SELECT * FROM elements WHERE is_base = 1 ORDER BY name ASC")
-            rows = cursor.fetchall()
+        cursor.execute(f"SELECT {_ELEMENT_COLS} FROM elements WHERE is_base = 1 ORDER BY name ASC")
+        rows = cursor.fetchall()
 
-            return [self._row_to_element(row) for row in rows]
+        return [self._row_to_element(row) for row in rows]
 
     def save_combination(self, combo_key: str, result_id: str, created_at: str) -> None:
         """Save a combination mapping for deterministic caching."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._write_lock:
+            cursor = self.conn.cursor()
 
             cursor.execute("""
                 INSERT OR REPLACE INTO combinations (combo_key, result_id, created_at)
                 VALUES (?, ?, ?)
             """, (combo_key, result_id, created_at))
 
-            conn.commit()
+            self.conn.commit()
+        self.version += 1
 
     def get_combination(self, combo_key: str) -> Optional[Element]:
         """Check if a combination has been done before."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cursor = self.conn.cursor()
 
-            cursor.execute("""
-                SELECT e.* FROM elements e
-                JOIN combinations c ON e.id = c.result_id
-                WHERE c.combo_key = ?
-            """, (combo_key,))
+        cursor.execute(_GET_COMBO_SQL, (combo_key,))
 
-            row = cursor.fetchone()
+        row = cursor.fetchone()
 
-            if row:
-                return self._row_to_element(row)
-            return None
+        if row:
+            return self._row_to_element(row)
+        return None
 
-    def _row_to_element(self, row) -> Element:
+    def _row_to_element(self, row: sqlite3.Row) -> Element:
         """Convert a database row to an Element object."""
         return Element(
-            id=row[0],
-            name=row[1],
-            description=row[2],
-            tags=json.loads(row[3]),
-            visual_hint=row[4],
-            behavior_hints=json.loads(row[5]),
-            is_base=bool(row[6]),
-            parent_a=row[7],
-            parent_b=row[8],
-            combination_order=row[9],
-            created_at=row[10],
-            properties=json.loads(row[11])
+            id=row["id"],
+            name=row["name"],
+            description=row["description"],
+            tags=_json_loads(row["tags"]),
+            visual_hint=row["visual_hint"],
+            behavior_hints=_json_loads(row["behavior_hints"]),
+            is_base=bool(row["is_base"]),
+            parent_a=row["parent_a"],
+            parent_b=row["parent_b"],
+            combination_order=row["combination_order"],
+            created_at=_created_at_value(row["created_at"]),
+            # properties is almost always the empty dict; skip the decode
+            properties=_json_loads(p) if (p := row["properties"]) and p != "{}" else {}
         )
 
     def get_stats(self) -> dict:
         """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM elements WHERE is_base = 1")
-            base_count = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM elements WHERE is_base = 0")
-            combined_count = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM combinations")
-            total_combinations = cursor.fetchone()[0]
-
-            return {
-                "base_elements": base_count,
-                "combined_elements": combined_count,
-                "total_elements": base_count + combined_count,
-                "total_combinations": total_combinations
-            }
+        cursor = self.conn.cursor()
+
+        # Single grouped count touches the is_base index once
+        base_count = 0
+        combined_count = 0
+        cursor.execute("SELECT is_base, COUNT(*) FROM elements GROUP BY is_base")
+        for is_base, count in cursor.fetchall():
+            if is_base:
+                base_count = count
+            else:
+                combined_count = count
+
+        cursor.execute("SELECT COUNT(*) FROM combinations")
+        total_combinations = cursor.fetchone()[0]
+
+        return {
+            "base_elements": base_count,
+            "combined_elements": combined_count,
+            "total_elements": base_count + combined_count,
+            "total_combinations": total_combinations
+        }
@@ -1,6 +1,7 @@
 """
 Core alchemy engine: Handles element combinations.
 """
+from typing import Optional
 from .models import Element
 from .database import AlchemyDatabase
 from .generator import ElementGenerator, GenerationError
@@ -24,12 +25,17 @@ class AlchemyEngine:
         self.db = database
         self.generator = generator
 
+        # (db version, element list) — interactive commands re-list the
+        # elements constantly; reuse the list until the db changes
+        self._cached_all: Optional[tuple[int, list[Element]]] = None
+        self._cached_with_parents: Optional[tuple[int, list]] = None
+
     def combine(
         self,
         element_a: Element,
         element_b: Element,
         verbose: bool = True
-    ) -> Element:
+    ) -> tuple[Element, bool]:
         """
         Combine two elements to create a new one.
 
@@ -43,7 +49,10 @@ class AlchemyEngine:
             verbose: Whether to print status messages
 
         Returns:
-            The resulting element (either cached or newly generated)
+            (result, was_new): the resulting element and whether this
+            combination was performed for the first time. The engine is
+            the only place that knows this before the combination is
+            stored, so callers get it for free instead of re-querying.
 
         Raises:
             GenerationError: If generation fails
@@ -56,7 +65,20 @@ class AlchemyEngine:
         if existing:
             if verbose:
                 print(f"\n✓ Found existing combination: {existing.name}")
-            return existing
+            return existing, False
+
+        # Degenerate input: combining an element with itself is fully
+        # deterministic, so don't burn an LLM call on it
+        if element_a.id == element_b.id:
+            new_element = self._self_combine(element_a)
+            self.db.save_element_and_combination(
+                new_element,
+                combo_key,
+                datetime.now().isoformat()
+            )
+            if verbose:
+                print(f"\n  ✨ Created: {new_element.name}")
+            return new_element, True
 
         # Generate new element
         if verbose:
@@ -65,18 +87,37 @@ class AlchemyEngine:
 
         new_element = self.generator.generate_combination(element_a, element_b)
 
-        # Save to database
-        self.db.save_element(new_element)
-        self.db.save_combination(
+        # Save element + combination mapping in one transaction
+        self.db.save_element_and_combination(
+            new_element,
             combo_key,
-            new_element.id,
             datetime.now().isoformat()
         )
 
         if verbose:
             print(f"  ✨ Created: {new_element.name}")
 
-        return new_element
+        return new_element, True
+
+    def _self_combine(self, element: Element) -> Element:
+        """
+        Build the deterministic result of combining an element with
+        itself: an intensified version of the same concept.
+        """
+        return Element(
+            name=f"Intensified {element.name}",
+            description=(
+                f"{element.name}, folded back into itself until its nature "
+                f"is magnified. {element.description}"
+            ),
+            tags=list(element.tags) + ["intensified"],
+            visual_hint=element.visual_hint,
+            behavior_hints=list(element.behavior_hints),
+            is_base=False,
+            parent_a=element.id,
+            parent_b=element.id,
+            combination_order=f"{element.id}+{element.id}"
+        )
 
     def get_element_by_id(self, element_id: str) -> Element:
         """Get an element by ID."""
@@ -93,41 +134,91 @@ class AlchemyEngine:
         return element
 
     def list_all_elements(self) -> list[Element]:
-        """Get all elements."""
-        return self.db.get_all_elements()
+        """Get all elements (cached until the database changes)."""
+        if self._cached_all is not None and self._cached_all[0] == self.db.version:
+            return self._cached_all[1]
+
+        elements = self.db.get_all_elements()
+        self._cached_all = (self.db.version, elements)
+        return elements
+
+    def list_all_with_id_map(self) -> tuple[list[Element], dict[str, Element]]:
+        """
+        Get all elements plus an id -> element map.
+
+        Callers that need parent names (e.g. the CLI list view) can resolve
+        them from the map instead of issuing one query per parent.
+        """
+        elements = self.list_all_elements()
+        return elements, {e.id: e for e in elements}
+
+    def list_all_with_parent_names(self) -> list[tuple[Element, Optional[str], Optional[str]]]:
+        """
+        Get (element, parent_a_name, parent_b_name) triples, resolved in
+        one SQL query and cached until the database changes.
+        """
+        if (
+            self._cached_with_parents is not None
+            and self._cached_with_parents[0] == self.db.version
+        ):
+            return self._cached_with_parents[1]
+
+        rows = self.db.get_all_with_parent_names()
+        self._cached_with_parents = (self.db.version, rows)
+        return rows
 
     def list_base_elements(self) -> list[Element]:
         """Get only base elements."""
         return self.db.get_base_elements()
 
-    def get_lineage(self, element: Element, depth: int = 0) -> str:
+    def get_lineage(self, element: Element) -> str:
         """
         Get a textual representation of an element's lineage tree.
 
+        Lineage is a DAG, not a tree: the same ancestor can appear under
+        both parents. A visited set stops re-expansion of shared subtrees,
+        keeping the walk linear in the number of distinct ancestors. All
+        lines accumulate into one list that is joined exactly once, so
+        string work stays linear in the output size.
+
         Args:
             element: The element to trace
-            depth: Current recursion depth (for indentation)
 
         Returns:
             Formatted string showing the element's ancestry
         """
+        out: list[str] = []
+        self._render_lineage(element, 0, out, set())
+        return "\n".join(out)
+
+    def _render_lineage(
+        self,
+        element: Element,
+        depth: int,
+        out: list[str],
+        visited: set[str]
+    ) -> None:
+        """Append lineage lines for one element to the shared accumulator."""
         indent = "  " * depth
-        lines = [f"{indent}{element.name}"]
+        if element.id in visited:
+            out.append(f"{indent}{element.name} (see above)")
+            return
+        visited.add(element.id)
+
+        out.append(f"{indent}{element.name}")
 
         if element.parent_a and element.parent_b:
             parent_a = self.db.get_element(element.parent_a)
             parent_b = self.db.get_element(element.parent_b)
 
             if parent_a and parent_b:
-                lines.append(f"{indent}├─ Base: {parent_a.name}")
+                out.append(f"{indent}├─ Base: {parent_a.name}")
                 if parent_a.parent_a:
-                    lines.append(self.get_lineage(parent_a, depth + 1))
+                    self._render_lineage(parent_a, depth + 1, out, visited)
 
-                lines.append(f"{indent}└─ Modifier: {parent_b.name}")
+                out.append(f"{indent}└─ Modifier: {parent_b.name}")
                 if parent_b.parent_a:
-                    lines.append(self.get_lineage(parent_b, depth + 1))
-
-        return "\n".join(lines)
+                    self._render_lineage(parent_b, depth + 1, out, visited)
 
     def get_stats(self) -> dict:
         """Get engine statistics."""
@@ -1,7 +1,12 @@
 """
 LLM-powered element generator using Ollama.
 """
+import hashlib
 import json
+import os
+import sqlite3
+import string
+import msgspec
 import requests
 from typing import Optional
 from .models import Element
@@ -11,7 +16,8 @@ from .config import (
     OLLAMA_MODEL,
     COMBINATION_PROMPT,
     MAX_RETRIES,
-    GENERATION_TIMEOUT
+    GENERATION_TIMEOUT,
+    PROMPT_CACHE_PATH
 )
 
 
@@ -20,6 +26,34 @@ class GenerationError(Exception):
     pass
 
 
+class ElementPayload(msgspec.Struct):
+    """Expected shape of the LLM's JSON response, validated at C speed."""
+    name: str
+    description: str
+    tags: list[str]
+    visual_hint: str
+    behavior_hints: list[str]
+
+
+# The combination prompt is parsed into (literal, field) segments once at
+# import time, so per-call formatting is a join instead of a full
+# str.format template walk.
+_PROMPT_PARTS = tuple(
+    (literal, field)
+    for literal, field, _spec, _conv in string.Formatter().parse(COMBINATION_PROMPT)
+)
+
+
+def _format_prompt(values: dict) -> str:
+    """Fill the pre-parsed combination prompt template."""
+    parts = []
+    for literal, field in _PROMPT_PARTS:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    return "".join(parts)
+
+
 class ElementGenerator:
     """Handles LLM-based generation of new elements."""
 
@@ -33,11 +67,47 @@ class ElementGenerator:
         self.model = model
         self.generate_url = f"{base_url}/api/generate"
         self.spell_circle_gen = SpellCircleGenerator()
+        self._cache_conn = self._init_prompt_cache(PROMPT_CACHE_PATH)
+
+        # Keep-alive session: reuse one TCP connection to Ollama instead
+        # of paying a fresh handshake per generation
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+
+    def _init_prompt_cache(self, cache_path: str) -> sqlite3.Connection:
+        """Open the on-disk prompt cache, creating it if needed."""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        conn = sqlite3.connect(cache_path, check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS prompt_cache (
+                prompt_hash TEXT PRIMARY KEY,
+                response TEXT
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def _cached_response(self, prompt_hash: str) -> Optional[str]:
+        """Look up a previously stored response for this prompt."""
+        row = self._cache_conn.execute(
+            "SELECT response FROM prompt_cache WHERE prompt_hash = ?",
+            (prompt_hash,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _store_response(self, prompt_hash: str, response: str) -> None:
+        """Persist a raw LLM response for future identical prompts."""
+        self._cache_conn.execute(
+            "INSERT OR IGNORE INTO prompt_cache (prompt_hash, response) VALUES (?, ?)",
+            (prompt_hash, response)
+        )
+        self._cache_conn.commit()
 
     def test_connection(self) -> bool:
         """Test if Ollama is running and accessible."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
@@ -63,21 +133,34 @@ class ElementGenerator:
         Raises:
             GenerationError: If generation fails after all retries
         """
-        # Build the prompt
-        prompt = COMBINATION_PROMPT.format(
-            element_a_name=element_a.name,
-            element_a_description=element_a.description,
-            element_a_tags=", ".join(element_a.tags),
-            element_b_name=element_b.name,
-            element_b_description=element_b.description,
-            element_b_tags=", ".join(element_b.tags)
-        )
+        # Build the prompt from the pre-parsed template
+        prompt = _format_prompt({
+            "element_a_name": element_a.name,
+            "element_a_description": element_a.description,
+            "element_a_tags": ", ".join(element_a.tags),
+            "element_b_name": element_b.name,
+            "element_b_description": element_b.description,
+            "element_b_tags": ", ".join(element_b.tags)
+        })
+
+        # Identical prompts (same model/template/element text) always map
+        # to the same canonical response, so re-runs skip the LLM entirely
+        prompt_hash = hashlib.sha256(
+            f"{self.model}\n{prompt}".encode()
+        ).hexdigest()
 
         # Try generation with retries
         for attempt in range(MAX_RETRIES):
             try:
-                response_data = self._call_ollama(prompt)
+                cached = None if attempt else self._cached_response(prompt_hash)
+                if cached is not None:
+                    response_data = cached
+                else:
+                    response_data = self._call_ollama(prompt)
                 element_data = self._parse_response(response_data)
+                if cached is None:
+                    # Only cache responses that parsed successfully
+                    self._store_response(prompt_hash, response_data)
 
                 # Create the new element
                 new_element = Element(
@@ -113,24 +196,67 @@ class ElementGenerator:
         raise GenerationError("Generation failed unexpectedly")
 
     def _call_ollama(self, prompt: str) -> str:
-        """Make API call to Ollama."""
+        """
+        Make a streaming API call to Ollama.
+
+        Tokens are accumulated as they arrive and the stream is cut off as
+        soon as the top-level JSON object closes (or the token cap hits),
+        instead of waiting out the full generation before parsing.
+        """
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
-            "format": "json"  # Request JSON format
+            "stream": True,
+            "format": "json",  # Request JSON format
+            "options": {"num_predict": 512}  # Hard cap on runaway outputs
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.generate_url,
                 json=payload,
-                timeout=GENERATION_TIMEOUT
+                timeout=GENERATION_TIMEOUT,
+                stream=True
             )
             response.raise_for_status()
 
-            result = response.json()
-            return result.get("response", "")
+            parts = []
+            # Brace-balance state (string-aware so braces inside values
+            # don't miscount)
+            depth = 0
+            started = False
+            in_string = False
+            escaped = False
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                token = chunk.get("response", "")
+                if token:
+                    parts.append(token)
+                    for ch in token:
+                        if escaped:
+                            escaped = False
+                        elif in_string:
+                            if ch == "\\":
+                                escaped = True
+                            elif ch == '"':
+                                in_string = False
+                        elif ch == '"':
+                            in_string = True
+                        elif ch == "{":
+                            depth += 1
+                            started = True
+                        elif ch == "}":
+                            depth -= 1
+                    if started and depth == 0:
+                        response.close()
+                        break
+                if chunk.get("done"):
+                    break
+
+            return "".join(parts)
 
         except requests.exceptions.RequestException as e:
             raise GenerationError(f"Ollama API error: {e}")
@@ -148,29 +274,27 @@ class ElementGenerator:
             "behavior_hints": ["hint1", "hint2", ...]
         }
         """
-        # Try to parse JSON
-        data = json.loads(response_text)
-
-        # Validate required fields
-        required_fields = ["name", "description", "tags", "visual_hint", "behavior_hints"]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field: {field}")
-
-        # Validate types
-        if not isinstance(data["tags"], list):
-            raise ValueError("tags must be a list")
-        if not isinstance(data["behavior_hints"], list):
-            raise ValueError("behavior_hints must be a list")
+        # Decode and type-check in one pass; msgspec rejects missing
+        # fields and wrong types without a Python-level field loop
+        try:
+            payload = msgspec.json.decode(response_text, type=ElementPayload)
+        except (msgspec.DecodeError, msgspec.ValidationError) as e:
+            raise ValueError(str(e))
 
         # Ensure at least some content
-        if len(data["name"].strip()) == 0:
+        if not payload.name.strip():
             raise ValueError("name cannot be empty")
-        if len(data["description"].strip()) == 0:
+        if not payload.description.strip():
             raise ValueError("description cannot be empty")
-        if len(data["tags"]) == 0:
+        if not payload.tags:
             raise ValueError("tags cannot be empty")
-        if len(data["behavior_hints"]) == 0:
+        if not payload.behavior_hints:
             raise ValueError("behavior_hints cannot be empty")
 
-        return data
+        return {
+            "name": payload.name,
+            "description": payload.description,
+            "tags": payload.tags,
+            "visual_hint": payload.visual_hint,
+            "behavior_hints": payload.behavior_hints,
+        }
@@ -4,6 +4,7 @@ Provides drag-and-drop element combination and discovery journal.
 """
 import pygame
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Tuple
 from .models import Element
 from .engine import AlchemyEngine
@@ -23,6 +24,85 @@ BUTTON_BG = (80, 100, 140)
 BUTTON_HOVER = (100, 120, 160)
 
 
+# Converted icon surfaces keyed by (element_id, size). The PIL decode +
+# bytes + fromstring path is far too slow to run per frame, so every
+# draw site goes through this cache instead.
+_surface_cache: dict[Tuple[str, int], pygame.Surface] = {}
+
+
+# Rendered text surfaces keyed by (text, font, color). SDL_ttf
+# rasterization is expensive and almost all GUI text repeats frame to
+# frame, so every draw site renders through this cache.
+_text_cache: dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def render_cached(font: pygame.font.Font, text: str,
+                  color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render text via the shared cache, rasterizing at most once."""
+    key = (text, id(font), color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+    return surface
+
+
+# Icon generation runs off the main thread so a first-time discovery
+# doesn't hitch the frame; a placeholder shows until the future resolves.
+# PIL releases the GIL in its core image ops, so rendering keeps going.
+_icon_pool = ThreadPoolExecutor(max_workers=2)
+_icon_futures: dict[Tuple[str, int], Future] = {}
+_placeholder_cache: dict[int, pygame.Surface] = {}
+
+
+def _placeholder_surface(size: int) -> pygame.Surface:
+    """Get a neutral disc shown while an icon is still being generated."""
+    surface = _placeholder_cache.get(size)
+    if surface is None:
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, SLOT_EMPTY, (size // 2, size // 2), size // 2)
+        _placeholder_cache[size] = surface
+    return surface
+
+
+def _get_icon_surface(element: Element, size: int) -> pygame.Surface:
+    """
+    Get the element's icon as a Pygame surface, converting at most once.
+
+    Uncached icons are generated on the worker pool; callers get a
+    placeholder until the result is ready (the main loop keeps
+    redrawing while any icon future is outstanding).
+    """
+    key = (element.id, size)
+    surface = _surface_cache.get(key)
+    if surface is not None:
+        return surface
+
+    future = _icon_futures.get(key)
+    if future is None:
+        _icon_futures[key] = _icon_pool.submit(
+            get_or_generate_icon, element.name, element.id, element.tags, size
+        )
+        return _placeholder_surface(size)
+    if not future.done():
+        return _placeholder_surface(size)
+
+    pil_icon = future.result()
+    del _icon_futures[key]
+
+    # frombuffer shares the pixel memory instead of copying and
+    # re-parsing it like fromstring; convert_alpha below makes the
+    # display-format copy that actually gets blitted
+    surface = pygame.image.frombuffer(
+        pil_icon.tobytes(), pil_icon.size, pil_icon.mode
+    )
+    # Converted surfaces match the display format and blit much faster
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    _surface_cache[key] = surface
+    return surface
+
+
 class ElementCard:
     """Represents a draggable element card."""
 
@@ -35,21 +115,12 @@ class ElementCard:
         self.offset_x = 0
         self.offset_y = 0
         self.icon = None
+        self._name_surface: Optional[pygame.Surface] = None
         self.load_icon()
 
     def load_icon(self):
         """Load the procedural icon for this element."""
-        pil_icon = get_or_generate_icon(
-            self.element.name,
-            self.element.id,
-            self.element.tags,
-            self.size
-        )
-        # Convert PIL image to Pygame surface
-        mode = pil_icon.mode
-        size = pil_icon.size
-        data = pil_icon.tobytes()
-        self.icon = pygame.image.fromstring(data, size, mode)
+        self.icon = _get_icon_surface(self.element, self.size)
 
     def get_rect(self) -> pygame.Rect:
         """Get the rectangle bounds of this card."""
@@ -75,6 +146,19 @@ class ElementCard:
         """Stop dragging this card."""
         self.dragging = False
 
+    def name_surface(self, font: pygame.font.Font) -> pygame.Surface:
+        """Get the rendered name label, rendering it at most once."""
+        if self._name_surface is None:
+            self._name_surface = render_cached(font, self.element.name, TEXT_COLOR)
+        return self._name_surface
+
+    def name_rect(self, font: pygame.font.Font) -> pygame.Rect:
+        """Get the label's position for the card's current location."""
+        return self.name_surface(font).get_rect(
+            centerx=self.x + self.size // 2,
+            top=self.y + self.size + 4
+        )
+
     def draw(self, screen: pygame.Surface, font: pygame.font.Font):
         """Draw the element card."""
         # Draw icon
@@ -82,10 +166,7 @@ class ElementCard:
             screen.blit(self.icon, (self.x, self.y))
 
         # Draw name below icon
-        name_surface = font.render(self.element.name, True, TEXT_COLOR)
-        name_rect = name_surface.get_rect(centerx=self.x + self.size // 2,
-                                         top=self.y + self.size + 4)
-        screen.blit(name_surface, name_rect)
+        screen.blit(self.name_surface(font), self.name_rect(font))
 
 
 class CombinationSlot:
@@ -131,31 +212,21 @@ class CombinationSlot:
 
         # Draw label
         if self.label:
-            label_surface = small_font.render(self.label, True, TEXT_DIM)
+            label_surface = render_cached(small_font, self.label, TEXT_DIM)
             label_rect = label_surface.get_rect(centerx=self.x + self.size // 2,
                                                bottom=self.y - 5)
             screen.blit(label_surface, label_rect)
 
         # Draw element if present
         if self.element:
-            icon = get_or_generate_icon(
-                self.element.name,
-                self.element.id,
-                self.element.tags,
-                self.size - 10
-            )
-            # Convert PIL to Pygame
-            mode = icon.mode
-            size = icon.size
-            data = icon.tobytes()
-            icon_surface = pygame.image.fromstring(data, size, mode)
+            icon_surface = _get_icon_surface(self.element, self.size - 10)
 
             icon_x = self.x + 5
             icon_y = self.y + 5
             screen.blit(icon_surface, (icon_x, icon_y))
 
             # Draw element name
-            name_surface = small_font.render(self.element.name, True, TEXT_COLOR)
+            name_surface = render_cached(small_font, self.element.name, TEXT_COLOR)
             name_rect = name_surface.get_rect(centerx=self.x + self.size // 2,
                                              top=self.y + self.size + 4)
             screen.blit(name_surface, name_rect)
@@ -190,12 +261,76 @@ class AlchemyGUI:
         self.result_element: Optional[Element] = None
         self.combining = False
 
+        # Journal cards are expensive to build (icon load per card), so
+        # they are rebuilt only when the element set changes; scrolling
+        # just shifts their y positions
+        self._cards: list[ElementCard] = []
+        self._cards_dirty = True
+        self._last_element_count = 0
+
+        # Repaint only in response to input; an idle GUI burns no CPU
+        # repainting an unchanged screen at 60 FPS
+        self._needs_redraw = True
+
+        # While dragging, everything except the dragged card is static:
+        # it's rendered once into _static_bg and only the two dirty
+        # regions (old and new card position) get repaired and pushed
+        self._static_bg: Optional[pygame.Surface] = None
+        self._drag_prev_rect: Optional[pygame.Rect] = None
+
         # Clock for FPS
         self.clock = pygame.time.Clock()
 
+        # Panel chrome (fills, borders, titles, hints) never changes, so
+        # it's painted once here and blitted as the frame starter
+        self._bg_surface = self._build_bg_surface()
+
+    def _build_bg_surface(self) -> pygame.Surface:
+        """Render the static panel chrome into a reusable background."""
+        bg = pygame.Surface((self.width, self.height))
+        bg.fill(BACKGROUND)
+
+        # Journal panel
+        panel_rect = pygame.Rect(10, 10, 350, self.height - 20)
+        pygame.draw.rect(bg, PANEL_BG, panel_rect, border_radius=10)
+        pygame.draw.rect(bg, PANEL_BORDER, panel_rect, width=2, border_radius=10)
+        bg.blit(render_cached(self.title_font, "Discovery Journal", TEXT_COLOR), (20, 20))
+
+        # Combination panel
+        panel_rect = pygame.Rect(370, 10, 460, self.height - 20)
+        pygame.draw.rect(bg, PANEL_BG, panel_rect, border_radius=10)
+        pygame.draw.rect(bg, PANEL_BORDER, panel_rect, width=2, border_radius=10)
+
+        title = render_cached(self.title_font, "Combination Lab", TEXT_COLOR)
+        bg.blit(title, title.get_rect(centerx=600, top=20))
+
+        instruction = render_cached(self.small_font, "Drag elements here to combine them", TEXT_DIM)
+        bg.blit(instruction, instruction.get_rect(centerx=600, top=60))
+
+        plus_text = render_cached(self.title_font, "+", TEXT_COLOR)
+        bg.blit(plus_text, plus_text.get_rect(center=(600, 340)))
+
+        arrow_text = render_cached(self.title_font, "↓", TEXT_COLOR)
+        bg.blit(arrow_text, arrow_text.get_rect(centerx=600, top=420))
+
+        hint = render_cached(self.small_font, "Press 'C' to clear slots | ESC to quit", TEXT_DIM)
+        bg.blit(hint, hint.get_rect(centerx=600, bottom=self.height - 30))
+
+        # Result panel
+        panel_rect = pygame.Rect(840, 10, 350, self.height - 20)
+        pygame.draw.rect(bg, PANEL_BG, panel_rect, border_radius=10)
+        pygame.draw.rect(bg, PANEL_BORDER, panel_rect, width=2, border_radius=10)
+
+        title = render_cached(self.title_font, "Result", TEXT_COLOR)
+        bg.blit(title, title.get_rect(centerx=1015, top=20))
+
+        return bg
+
     def get_all_elements(self) -> list[Element]:
         """Get all discovered elements from the engine."""
-        return self.engine.db.get_all_elements()
+        # Version-cached on the engine: steady-state frames cost a dict
+        # lookup, not a SQLite query
+        return self.engine.list_all_elements()
 
     def create_element_cards(self) -> list[ElementCard]:
         """Create element cards for the discovery journal."""
@@ -213,16 +348,47 @@ class AlchemyGUI:
             row = i // cards_per_row
             col = i % cards_per_row
             x = start_x + col * (card_size + padding + 60)
-            y = start_y + row * (card_size + padding + 30) - self.scroll_offset
+            y = start_y + row * (card_size + padding + 30)
 
             card = ElementCard(element, x, y, card_size)
+            # Home position; _get_cards applies the scroll offset and
+            # snaps cards back here after a drag
+            card.base_x = x
+            card.base_y = y
             cards.append(card)
 
         return cards
 
+    def _get_cards(self) -> list[ElementCard]:
+        """
+        Get the journal cards, rebuilding only when the element set has
+        changed. Scrolling is applied by shifting existing cards rather
+        than recreating them (and reloading every icon) each frame.
+        """
+        elements = self.get_all_elements()
+        if self._cards_dirty or len(elements) != self._last_element_count:
+            self._cards = self.create_element_cards()
+            self._last_element_count = len(elements)
+            self._cards_dirty = False
+
+        for card in self._cards:
+            if not card.dragging:
+                card.x = card.base_x
+                card.y = card.base_y - self.scroll_offset
+
+        # Swap placeholders for finished icons as futures resolve
+        if _icon_futures:
+            for card in self._cards:
+                card.load_icon()
+
+        return self._cards
+
     def handle_events(self):
         """Handle pygame events."""
         for event in pygame.event.get():
+            # Any input can change what's on screen
+            self._needs_redraw = True
+
             if event.type == pygame.QUIT:
                 return False
 
@@ -259,7 +425,7 @@ class AlchemyGUI:
     def handle_mouse_down(self, mouse_x: int, mouse_y: int):
         """Handle mouse button down."""
         # Check if clicking on an element card in the journal
-        cards = self.create_element_cards()
+        cards = self._get_cards()
         for card in cards:
             # Only allow dragging from journal area (left panel)
             if mouse_x < 350 and card.contains_point(mouse_x, mouse_y):
@@ -287,132 +453,139 @@ class AlchemyGUI:
         if self.dragging_card:
             self.dragging_card.update_drag(mouse_x, mouse_y)
 
-        # Update slot hover states
-        self.slot_a.hover = self.slot_a.contains_point(mouse_x, mouse_y)
-        self.slot_b.hover = self.slot_b.contains_point(mouse_x, mouse_y)
+        # Update slot hover states; a hover change makes the cached
+        # drag background stale
+        hover_a = self.slot_a.contains_point(mouse_x, mouse_y)
+        hover_b = self.slot_b.contains_point(mouse_x, mouse_y)
+        if hover_a != self.slot_a.hover or hover_b != self.slot_b.hover:
+            self._static_bg = None
+        self.slot_a.hover = hover_a
+        self.slot_b.hover = hover_b
 
     def check_combination(self):
         """Check if both slots are filled and combine."""
         if self.slot_a.element and self.slot_b.element:
             # Perform combination
-            self.result_element = self.engine.combine(
+            self.result_element, was_new = self.engine.combine(
                 self.slot_a.element,
                 self.slot_b.element
             )
+            # Drop any stale cached surfaces for the result so its icon
+            # is regenerated fresh on the next draw
+            result_id = self.result_element.id
+            for key in [k for k in _surface_cache if k[0] == result_id]:
+                del _surface_cache[key]
+            # Only a genuinely new element changes the journal
+            if was_new:
+                self._cards_dirty = True
 
     def draw(self):
         """Draw the entire GUI."""
-        # Clear screen
-        self.screen.fill(BACKGROUND)
+        if self.dragging_card:
+            self._draw_drag_frame()
+            return
+        self._static_bg = None
+        self._drag_prev_rect = None
+
+        # Start from the pre-rendered panel chrome
+        self.screen.blit(self._bg_surface, (0, 0))
 
         # Draw panels
         self.draw_journal_panel()
         self.draw_combination_panel()
         self.draw_result_panel()
 
-        # Draw dragging card on top
-        if self.dragging_card:
-            self.dragging_card.draw(self.screen, self.small_font)
-
         pygame.display.flip()
 
-    def draw_journal_panel(self):
-        """Draw the discovery journal panel."""
-        # Panel background
-        panel_rect = pygame.Rect(10, 10, 350, self.height - 20)
-        pygame.draw.rect(self.screen, PANEL_BG, panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, PANEL_BORDER, panel_rect, width=2, border_radius=10)
-
-        # Title
-        title = self.title_font.render("Discovery Journal", True, TEXT_COLOR)
-        self.screen.blit(title, (20, 20))
+    def _drag_rect(self) -> pygame.Rect:
+        """Bounding rect of the dragged card including its name label."""
+        card = self.dragging_card
+        return card.get_rect().union(card.name_rect(self.small_font))
+
+    def _draw_drag_frame(self) -> None:
+        """
+        Fast path for drag frames: restore the static background under
+        the card's old and new positions, redraw the card, and push only
+        those two rects instead of flipping the whole window. The first
+        drag frame (or any frame after the background went stale) does a
+        full paint and caches it.
+        """
+        if self._static_bg is None or self._drag_prev_rect is None:
+            # Seed the background with a full scene minus the drag card
+            self.screen.blit(self._bg_surface, (0, 0))
+            self.draw_journal_panel()
+            self.draw_combination_panel()
+            self.draw_result_panel()
+            self._static_bg = self.screen.copy()
+            self.dragging_card.draw(self.screen, self.small_font)
+            self._drag_prev_rect = self._drag_rect()
+            pygame.display.flip()
+            return
+
+        old_rect = self._drag_prev_rect
+        new_rect = self._drag_rect()
+        self.screen.blit(self._static_bg, old_rect, old_rect)
+        self.screen.blit(self._static_bg, new_rect, new_rect)
+        self.dragging_card.draw(self.screen, self.small_font)
+        pygame.display.update([old_rect, new_rect])
+        self._drag_prev_rect = new_rect
 
+    def draw_journal_panel(self):
+        """Draw the dynamic content of the discovery journal panel."""
         # Element count
         element_count = len(self.get_all_elements())
-        count_text = self.small_font.render(f"{element_count} elements discovered", True, TEXT_DIM)
+        count_text = render_cached(self.small_font, f"{element_count} elements discovered", TEXT_DIM)
         self.screen.blit(count_text, (20, 55))
 
         # Draw element cards (with clipping to panel)
         clip_rect = pygame.Rect(10, 70, 350, self.height - 80)
         self.screen.set_clip(clip_rect)
 
-        cards = self.create_element_cards()
+        # Batch all icon and label blits into two blits calls — one C
+        # dispatch each instead of a Python-level blit per card. Cards
+        # scrolled fully outside the clip area are skipped outright:
+        # even clipped-away blits pay dispatch cost per call.
+        cards = self._get_cards()
+        clip_top = clip_rect.top
+        clip_bottom = clip_rect.bottom
+        label_height = self.small_font.get_height() + 4
+        icon_blits = []
+        name_blits = []
         for card in cards:
-            if not card.dragging:  # Don't draw if being dragged
-                card.draw(self.screen, self.small_font)
+            if card.dragging:  # Don't draw if being dragged
+                continue
+            if card.y > clip_bottom or card.y + card.size + label_height < clip_top:
+                continue
+            if card.icon:
+                icon_blits.append((card.icon, (card.x, card.y)))
+            name_blits.append(
+                (card.name_surface(self.small_font), card.name_rect(self.small_font))
+            )
+        self.screen.blits(icon_blits, doreturn=False)
+        self.screen.blits(name_blits, doreturn=False)
 
         self.screen.set_clip(None)
 
     def draw_combination_panel(self):
-        """Draw the combination panel."""
-        # Panel background
-        panel_rect = pygame.Rect(370, 10, 460, self.height - 20)
-        pygame.draw.rect(self.screen, PANEL_BG, panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, PANEL_BORDER, panel_rect, width=2, border_radius=10)
-
-        # Title
-        title = self.title_font.render("Combination Lab", True, TEXT_COLOR)
-        title_rect = title.get_rect(centerx=600, top=20)
-        self.screen.blit(title, title_rect)
-
-        # Instructions
-        instruction = self.small_font.render("Drag elements here to combine them", True, TEXT_DIM)
-        instruction_rect = instruction.get_rect(centerx=600, top=60)
-        self.screen.blit(instruction, instruction_rect)
-
+        """Draw the dynamic content of the combination panel."""
         # Draw combination slots
         self.slot_a.draw(self.screen, self.font, self.small_font)
         self.slot_b.draw(self.screen, self.font, self.small_font)
 
-        # Draw plus sign between slots
-        plus_text = self.title_font.render("+", True, TEXT_COLOR)
-        plus_rect = plus_text.get_rect(center=(600, 340))
-        self.screen.blit(plus_text, plus_rect)
-
-        # Draw arrow pointing down
-        arrow_text = self.title_font.render("↓", True, TEXT_COLOR)
-        arrow_rect = arrow_text.get_rect(centerx=600, top=420)
-        self.screen.blit(arrow_text, arrow_rect)
-
-        # Keyboard shortcut hint
-        hint = self.small_font.render("Press 'C' to clear slots | ESC to quit", True, TEXT_DIM)
-        hint_rect = hint.get_rect(centerx=600, bottom=self.height - 30)
-        self.screen.blit(hint, hint_rect)
-
     def draw_result_panel(self):
-        """Draw the result panel."""
-        # Panel background
-        panel_rect = pygame.Rect(840, 10, 350, self.height - 20)
-        pygame.draw.rect(self.screen, PANEL_BG, panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, PANEL_BORDER, panel_rect, width=2, border_radius=10)
-
-        # Title
-        title = self.title_font.render("Result", True, TEXT_COLOR)
-        title_rect = title.get_rect(centerx=1015, top=20)
-        self.screen.blit(title, title_rect)
-
+        """Draw the dynamic content of the result panel."""
         # Draw result element if present
         if self.result_element:
             # Large icon
             icon_size = 100
-            icon = get_or_generate_icon(
-                self.result_element.name,
-                self.result_element.id,
-                self.result_element.tags,
-                icon_size
-            )
-            # Convert PIL to Pygame
-            mode = icon.mode
-            size = icon.size
-            data = icon.tobytes()
-            icon_surface = pygame.image.fromstring(data, size, mode)
+            icon_surface = _get_icon_surface(self.result_element, icon_size)
 
             icon_x = 1015 - icon_size // 2
             icon_y = 100
             self.screen.blit(icon_surface, (icon_x, icon_y))
 
             # Name
-            name_text = self.title_font.render(self.result_element.name, True, TEXT_COLOR)
+            name_text = render_cached(self.title_font, self.result_element.name, TEXT_COLOR)
             name_rect = name_text.get_rect(centerx=1015, top=220)
             self.screen.blit(name_text, name_rect)
 
@@ -425,26 +598,26 @@ class AlchemyGUI:
 
             # Tags
             tags_y = 420
-            tags_title = self.small_font.render("Tags:", True, TEXT_COLOR)
+            tags_title = render_cached(self.small_font, "Tags:", TEXT_COLOR)
             self.screen.blit(tags_title, (850, tags_y))
 
             tags_text = ", ".join(self.result_element.tags[:5])  # Limit to 5 tags
-            tags_surface = self.small_font.render(tags_text, True, TEXT_DIM)
+            tags_surface = render_cached(self.small_font, tags_text, TEXT_DIM)
             self.screen.blit(tags_surface, (850, tags_y + 25))
 
             # Is it new?
             if hasattr(self, 'last_was_new') and self.last_was_new:
-                new_text = self.title_font.render("⭐ NEW DISCOVERY! ⭐", True, (255, 215, 0))
+                new_text = render_cached(self.title_font, "⭐ NEW DISCOVERY! ⭐", (255, 215, 0))
                 new_rect = new_text.get_rect(centerx=1015, top=500)
                 self.screen.blit(new_text, new_rect)
 
         else:
             # Placeholder text
-            placeholder = self.font.render("Combine elements to", True, TEXT_DIM)
+            placeholder = render_cached(self.font, "Combine elements to", TEXT_DIM)
             placeholder_rect = placeholder.get_rect(centerx=1015, centery=300)
             self.screen.blit(placeholder, placeholder_rect)
 
-            placeholder2 = self.font.render("see the result", True, TEXT_DIM)
+            placeholder2 = render_cached(self.font, "see the result", TEXT_DIM)
             placeholder2_rect = placeholder2.get_rect(centerx=1015, centery=330)
             self.screen.blit(placeholder2, placeholder2_rect)
 
@@ -457,9 +630,9 @@ class AlchemyGUI:
 
         for word in words:
             test_line = ' '.join(current_line + [word])
-            test_surface = font.render(test_line, True, color)
 
-            if test_surface.get_width() <= max_width:
+            # font.size measures without rasterizing a surface
+            if font.size(test_line)[0] <= max_width:
                 current_line.append(word)
             else:
                 if current_line:
@@ -472,7 +645,7 @@ class AlchemyGUI:
         # Draw lines
         line_height = font.get_height() + 4
         for i, line in enumerate(lines):
-            line_surface = font.render(line, True, color)
+            line_surface = render_cached(font, line, color)
             self.screen.blit(line_surface, (x, y + i * line_height))
 
     def run(self):
@@ -481,7 +654,15 @@ class AlchemyGUI:
 
         while running:
             running = self.handle_events()
-            self.draw()
+            # Keep repainting while icons are still generating so
+            # placeholders get replaced as their futures resolve
+            if _icon_futures:
+                self._needs_redraw = True
+            # Skip the repaint entirely when nothing changed; an active
+            # drag keeps redrawing so the card tracks the cursor
+            if self._needs_redraw or self.dragging_card:
+                self.draw()
+                self._needs_redraw = False
             self.clock.tick(60)  # 60 FPS
 
         pygame.quit()
@@ -3,10 +3,13 @@ Procedural icon generation for alchemical elements.
 Creates unique visual representations based on element properties.
 """
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 from typing import Tuple
 import hashlib
 import os
 
+import numpy as np
+
 
 # Tag to color mapping (RGB)
 TAG_COLORS = {
@@ -49,6 +52,32 @@ TAG_COLORS = {
 }
 
 
+@lru_cache(maxsize=512)
+def _colors_for(tags_tuple: Tuple[str, ...]) -> Tuple[Tuple[int, int, int],
+                                                      Tuple[int, int, int]]:
+    """
+    Resolve (primary, secondary) colors for a tag tuple in one memoized
+    pass, so icon generation doesn't scan the tags twice.
+    """
+    # Try to find a matching tag color
+    primary = next((TAG_COLORS[t] for t in tags_tuple if t in TAG_COLORS), None)
+    if primary is None:
+        # Fallback: deterministic color from tag hash, else default gray
+        primary = _tag_fallback_color(tags_tuple[0]) if tags_tuple else (128, 128, 128)
+
+    # Use second tag if available, otherwise brighten the primary
+    if len(tags_tuple) > 1 and tags_tuple[1] in TAG_COLORS:
+        secondary = TAG_COLORS[tags_tuple[1]]
+    else:
+        secondary = (
+            min(255, primary[0] + 50),
+            min(255, primary[1] + 50),
+            min(255, primary[2] + 50)
+        )
+
+    return primary, secondary
+
+
 def get_element_color(tags: list[str]) -> Tuple[int, int, int]:
     """
     Determine primary color for an element based on its tags.
@@ -59,21 +88,23 @@ def get_element_color(tags: list[str]) -> Tuple[int, int, int]:
     Returns:
         RGB color tuple
     """
-    # Try to find a matching tag color
-    for tag in tags:
-        if tag in TAG_COLORS:
-            return TAG_COLORS[tag]
+    return _colors_for(tuple(tags))[0]
 
-    # Fallback: generate deterministic color from tag hash
-    if tags:
-        hash_val = int(hashlib.md5(tags[0].encode()).hexdigest()[:6], 16)
-        r = (hash_val >> 16) & 0xFF
-        g = (hash_val >> 8) & 0xFF
-        b = hash_val & 0xFF
-        return (r, g, b)
 
-    # Default gray
-    return (128, 128, 128)
+@lru_cache(maxsize=256)
+def _tag_fallback_color(tag: str) -> Tuple[int, int, int]:
+    """Derive (and memoize) a deterministic color from a tag's hash."""
+    hash_val = int(hashlib.md5(tag.encode()).hexdigest()[:6], 16)
+    r = (hash_val >> 16) & 0xFF
+    g = (hash_val >> 8) & 0xFF
+    b = hash_val & 0xFF
+    return (r, g, b)
+
+
+@lru_cache(maxsize=512)
+def _name_hash(name: str) -> int:
+    """Memoized 32-bit hash of an element name for pattern placement."""
+    return int(hashlib.md5(name.encode()).hexdigest()[:8], 16)
 
 
 def get_secondary_color(tags: list[str]) -> Tuple[int, int, int]:
@@ -86,17 +117,7 @@ def get_secondary_color(tags: list[str]) -> Tuple[int, int, int]:
     Returns:
         RGB color tuple
     """
-    # Use second tag if available
-    if len(tags) > 1 and tags[1] in TAG_COLORS:
-        return TAG_COLORS[tags[1]]
-
-    # Otherwise brighten/darken the primary color
-    primary = get_element_color(tags)
-    return (
-        min(255, primary[0] + 50),
-        min(255, primary[1] + 50),
-        min(255, primary[2] + 50)
-    )
+    return _colors_for(tuple(tags))[1]
 
 
 def create_gradient_circle(size: int, color1: Tuple[int, int, int],
@@ -112,70 +133,85 @@ def create_gradient_circle(size: int, color1: Tuple[int, int, int],
     Returns:
         PIL Image with gradient circle
     """
-    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(image)
+    return Image.fromarray(_gradient_array(size, color1, color2), 'RGBA')
 
+
+def _gradient_array(size: int, color1: Tuple[int, int, int],
+                    color2: Tuple[int, int, int]) -> "np.ndarray":
+    """Build the radial gradient as an RGBA uint8 array."""
     center = size // 2
 
-    # Draw gradient in concentric circles
-    steps = 50
-    for i in range(steps):
-        t = i / steps
-        # Interpolate colors
-        r = int(color1[0] * (1 - t) + color2[0] * t)
-        g = int(color1[1] * (1 - t) + color2[1] * t)
-        b = int(color1[2] * (1 - t) + color2[2] * t)
-
-        # Calculate radius for this step
-        radius = center * (1 - t)
-
-        # Draw circle
-        bbox = [
-            center - radius, center - radius,
-            center + radius, center + radius
-        ]
-        draw.ellipse(bbox, fill=(r, g, b, 255))
+    # One vectorized pass over a radial distance field replaces the old
+    # loop of 50 concentric ellipse fills (each repainting most pixels)
+    yy, xx = np.ogrid[:size, :size]
+    dist = np.sqrt((xx - center) ** 2 + (yy - center) ** 2)
+    t = np.clip(dist / center, 0.0, 1.0)[..., None]
 
-    return image
+    c1 = np.array(color2, dtype=np.float64)  # center color
+    c2 = np.array(color1, dtype=np.float64)  # edge color
+    rgb = (c1 * (1 - t) + c2 * t).astype(np.uint8)
+    alpha = ((dist <= center) * 255).astype(np.uint8)
+
+    return np.dstack([rgb, alpha])
+
+
+def _stamp_dots(arr: "np.ndarray", dots: list[Tuple[int, int, int]],
+                color: Tuple[int, int, int, int]) -> None:
+    """Write filled (x, y, r) disks straight into the RGBA array."""
+    size = arr.shape[0]
+    yy, xx = np.ogrid[:size, :size]
+    for x, y, r in dots:
+        arr[(xx - x) ** 2 + (yy - y) ** 2 <= r * r] = color
 
 
-def add_pattern_overlay(image: Image.Image, tags: list[str],
+def add_pattern_overlay(arr: "np.ndarray", tags: list[str],
                         name: str) -> Image.Image:
     """
     Add decorative patterns based on element properties.
 
+    Dot patterns are stamped directly into the RGBA array (one numpy
+    mask write per disk instead of a PIL call each); the arc pattern
+    stays in PIL since it fires once per generated icon.
+
     Args:
-        image: Base image to overlay on
+        arr: Base RGBA array to overlay on (modified in place)
         tags: Element tags
         name: Element name
 
     Returns:
         Image with pattern overlay
     """
-    draw = ImageDraw.Draw(image)
-    size = image.size[0]
+    size = arr.shape[0]
     center = size // 2
+    tag_set = frozenset(tags)
 
     # Add patterns based on tags
-    if "structured" in tags or "lawful" in tags or "ordered" in tags:
-        # Draw geometric grid pattern
-        for i in range(4):
-            angle = i * 90
-            x = center + int(center * 0.6 * (1 if i % 2 == 0 else -1))
-            y = center
-            draw.ellipse([x-3, y-3, x+3, y+3], fill=(255, 255, 255, 180))
-
-    if "wild" in tags or "chaotic" in tags or "unpredictable" in tags:
-        # Draw random-ish splatters
-        hash_val = int(hashlib.md5(name.encode()).hexdigest()[:8], 16)
-        for i in range(5):
-            x = center + ((hash_val >> (i * 3)) % 40 - 20)
-            y = center + ((hash_val >> (i * 3 + 8)) % 40 - 20)
-            r = 2 + (hash_val >> (i * 2)) % 3
-            draw.ellipse([x-r, y-r, x+r, y+r], fill=(255, 255, 255, 100))
-
-    if "flowing" in tags or "fluid" in tags:
+    if "structured" in tag_set or "lawful" in tag_set or "ordered" in tag_set:
+        # Stamp geometric grid pattern
+        dots = [
+            (center + int(center * 0.6 * (1 if i % 2 == 0 else -1)), center, 3)
+            for i in range(4)
+        ]
+        _stamp_dots(arr, dots, (255, 255, 255, 180))
+
+    if "wild" in tag_set or "chaotic" in tag_set or "unpredictable" in tag_set:
+        # Stamp random-ish splatters
+        hash_val = _name_hash(name)
+        dots = [
+            (
+                center + ((hash_val >> (i * 3)) % 40 - 20),
+                center + ((hash_val >> (i * 3 + 8)) % 40 - 20),
+                2 + (hash_val >> (i * 2)) % 3
+            )
+            for i in range(5)
+        ]
+        _stamp_dots(arr, dots, (255, 255, 255, 100))
+
+    image = Image.fromarray(arr, 'RGBA')
+
+    if "flowing" in tag_set or "fluid" in tag_set:
         # Draw wave pattern
+        draw = ImageDraw.Draw(image)
         draw.arc([center-25, center-25, center+25, center+25],
                  0, 180, fill=(255, 255, 255, 150), width=2)
         draw.arc([center-25, center-25, center+25, center+25],
@@ -197,15 +233,12 @@ def generate_icon(element_name: str, tags: list[str],
     Returns:
         PIL Image of the icon
     """
-    # Get colors based on tags
-    primary_color = get_element_color(tags)
-    secondary_color = get_secondary_color(tags)
-
-    # Create base gradient circle
-    icon = create_gradient_circle(size, primary_color, secondary_color)
+    # Get colors based on tags (one memoized lookup for both)
+    primary_color, secondary_color = _colors_for(tuple(tags))
 
-    # Add pattern overlay
-    icon = add_pattern_overlay(icon, tags, element_name)
+    # Create base gradient circle as a raw array, pattern it, then wrap
+    arr = _gradient_array(size, primary_color, secondary_color)
+    icon = add_pattern_overlay(arr, tags, element_name)
 
     # Add outer glow/border
     draw = ImageDraw.Draw(icon)
@@ -219,16 +252,48 @@ def save_icon(icon: Image.Image, element_id: str, cache_dir: str = "data/icons")
     """
     Save an icon to the cache directory.
 
+    The raw RGBA array goes to a .npy file — the load path of record,
+    since np.load skips PNG chunk parsing and zlib inflate entirely.
+    A PNG is written alongside as a human-viewable export.
+
     Args:
         icon: PIL Image to save
         element_id: Unique element ID
         cache_dir: Directory to save icons
     """
     os.makedirs(cache_dir, exist_ok=True)
+    np.save(os.path.join(cache_dir, f"{element_id}.npy"), np.asarray(icon))
     filepath = os.path.join(cache_dir, f"{element_id}.png")
     icon.save(filepath, "PNG")
 
 
+@lru_cache(maxsize=512)
+def _cached_icon(element_name: str, element_id: str, tags: tuple[str, ...],
+                 size: int, cache_dir: str) -> Image.Image:
+    """
+    In-process icon memo behind get_or_generate_icon.
+
+    Keeps the decoded PIL image in memory so repeat requests (e.g. the
+    result panel redrawing each frame) skip the stat + PNG decode, and
+    a freshly generated icon never round-trips through the disk at all.
+    """
+    # Try to load from cache: raw pixels first (no PNG decode), then
+    # any PNG left by an older version
+    raw_path = os.path.join(cache_dir, f"{element_id}.npy")
+    if os.path.exists(raw_path):
+        return Image.fromarray(np.load(raw_path), 'RGBA')
+
+    filepath = os.path.join(cache_dir, f"{element_id}.png")
+    if os.path.exists(filepath):
+        return Image.open(filepath)
+
+    # Generate new icon
+    icon = generate_icon(element_name, list(tags), size)
+    save_icon(icon, element_id, cache_dir)
+
+    return icon
+
+
 def get_or_generate_icon(element_name: str, element_id: str, tags: list[str],
                         size: int = 64, cache_dir: str = "data/icons") -> Image.Image:
     """
@@ -244,14 +309,4 @@ def get_or_generate_icon(element_name: str, element_id: str, tags: list[str],
     Returns:
         PIL Image of the icon
     """
-    filepath = os.path.join(cache_dir, f"{element_id}.png")
-
-    # Try to load from cache
-    if os.path.exists(filepath):
-        return Image.open(filepath)
-
-    # Generate new icon
-    icon = generate_icon(element_name, tags, size)
-    save_icon(icon, element_id, cache_dir)
-
-    return icon
+    return _cached_icon(element_name, element_id, tuple(tags), size, cache_dir)
@@ -1,29 +1,38 @@
 """
 Data models for the Alchemy Engine.
 """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
+import time
 import uuid
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Element:
     """
     Represents an alchemical element.
 
     Elements can be base elements (fire, water, etc.) or combinations of other elements.
     Order matters in combinations: Fire + Water != Water + Fire
+
+    Slots keep per-instance memory down (no __dict__) and speed attribute
+    access — the element table is held fully in memory and grows with
+    every discovery.
     """
     name: str
     description: str
-    tags: list[str]
+    # Tags are a tuple: they're used as cache keys (icon colors, icon
+    # memo) and iterated far more often than they're built, so keeping
+    # them hashable avoids a tuple() conversion at every lookup site
+    tags: tuple[str, ...]
     visual_hint: str
     behavior_hints: list[str]
 
-    # Unique identifier
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Unique identifier — .hex skips the dashed-string formatting of
+    # str(uuid4()) while staying globally unique across sessions
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
 
     # Lineage tracking
     is_base: bool = False
@@ -31,19 +40,79 @@ class Element:
     parent_b: Optional[str] = None  # Element ID of second parent
     combination_order: Optional[str] = None  # "parent_a_id+parent_b_id"
 
-    # Metadata
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Metadata — stored as a raw epoch timestamp; time.time() is far
+    # cheaper than building and formatting a datetime per construction,
+    # and display paths format it lazily via created_at_iso()
+    created_at: float = field(default_factory=time.time)
 
     # Flexible properties for future use
     properties: dict = field(default_factory=dict)
 
+    # Frozen membership views built once at construction: checks like
+    # `"heat" in element.tag_set` and set intersections between elements
+    # are hash lookups instead of linear scans over the ordered tuple
+    tag_set: frozenset = field(init=False, repr=False, compare=False)
+    behavior_set: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept lists from callers and deserializers transparently
+        if not isinstance(self.tags, tuple):
+            self.tags = tuple(self.tags)
+        self.tag_set = frozenset(self.tags)
+        self.behavior_set = frozenset(self.behavior_hints)
+
+    def created_at_iso(self) -> str:
+        """Format the creation timestamp as an ISO-8601 string."""
+        return datetime.fromtimestamp(self.created_at).isoformat()
+
     def to_dict(self) -> dict:
         """Convert element to dictionary for JSON serialization."""
-        return asdict(self)
+        # Built by hand: dataclasses.asdict reflects over fields and
+        # deep-copies every container, which dominates bulk-save time
+        return {
+            "name": self.name,
+            "description": self.description,
+            "tags": list(self.tags),
+            "visual_hint": self.visual_hint,
+            "behavior_hints": list(self.behavior_hints),
+            "id": self.id,
+            "is_base": self.is_base,
+            "parent_a": self.parent_a,
+            "parent_b": self.parent_b,
+            "combination_order": self.combination_order,
+            "created_at": self.created_at_iso(),
+            "properties": dict(self.properties),
+        }
+
+    def as_response_dict(self) -> dict:
+        """
+        Shape the element for the web API (emoji/definition naming).
+
+        One direct-attribute pass building the exact key set the API
+        emits; parent names are left for the caller, which resolves
+        them in bulk.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "emoji": self.visual_hint,
+            "definition": self.description,
+            "is_base": self.is_base,
+            "tags": list(self.tags),
+            "behavior_hints": list(self.behavior_hints),
+            "parent_a_id": self.parent_a,
+            "parent_b_id": self.parent_b,
+            "parent_a_name": None,
+            "parent_b_name": None,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Element':
         """Create an Element from a dictionary."""
+        created_at = data.get("created_at")
+        if isinstance(created_at, str):
+            # Older serializations stored the ISO string directly
+            data = {**data, "created_at": datetime.fromisoformat(created_at).timestamp()}
         return cls(**data)
 
     def __str__(self) -> str:
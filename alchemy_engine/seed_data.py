@@ -1,100 +1,161 @@
 """
 Seed data: Base elements for the alchemy system.
 """
+import hashlib
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .config import SPELL_CIRCLE_CACHE_DIR
 from .models import Element
 from .spell_circle_generator import SpellCircleGenerator
 
 
+# One generator for the whole module: construction happens once at
+# import instead of on every seed/rebuild call, and any state the
+# generator accumulates internally stays warm across calls
+_GENERATOR = SpellCircleGenerator()
+
+
+# Built once on first use: the inputs are hardcoded constants, so
+# repeated calls (re-init checks, tests) shouldn't re-run object
+# construction and eight SVG generations
+_BASE_ELEMENTS: Optional[list[Element]] = None
+
+
 def get_base_elements() -> list[Element]:
     """
     Returns the foundational elements that all others are built from.
 
     These are carefully crafted to have rich, diverse properties that
-    can combine in interesting ways.
+    can combine in interesting ways. The set is built once per process;
+    callers get a fresh list over the shared Element instances.
+    """
+    global _BASE_ELEMENTS
+    if _BASE_ELEMENTS is None:
+        # Each element is independent, so build them (spell circle
+        # included) across a small worker pool instead of back to back
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            _BASE_ELEMENTS = list(executor.map(_make_element, _BASE_ELEMENT_SPECS))
+    return list(_BASE_ELEMENTS)
+
+
+def _make_element(spec: dict) -> Element:
+    """
+    Construct one base element with its spell circle already attached.
+
+    Single pass per element: no placeholder-then-mutate second loop.
+    The emoji in the spec only exists as the generator's fallback visual
+    until the SVG replaces it within the same call. (Generating from a
+    lazy property on Element itself would pull the generator into
+    models and create an import cycle.)
+    """
+    element = Element(**spec, is_base=True)
+    element.visual_hint = _cached_generate(element)
+    return element
+
+
+def _cached_generate(element: Element) -> str:
+    """
+    Generate a spell circle SVG, backed by a disk cache keyed on the
+    element name.
+
+    Base element circles are fixed designs, so re-seeding after a DB
+    wipe (or in CI) should be a file read, not a fresh SVG assembly.
+    The write goes through a temp file + os.replace so a crash mid-write
+    never leaves a truncated cache entry.
+    """
+    path = os.path.join(
+        SPELL_CIRCLE_CACHE_DIR,
+        f"{hashlib.sha1(element.name.encode()).hexdigest()}.svg",
+    )
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    svg = _GENERATOR.generate(element)
+
+    os.makedirs(SPELL_CIRCLE_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=SPELL_CIRCLE_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(svg)
+    os.replace(tmp_path, path)
+
+    return svg
+
+
+def _interned(*strings: str) -> tuple[str, ...]:
+    """
+    Intern short tag/hint strings so every element sharing a tag shares
+    one string object: equality checks become pointer compares and the
+    cached hash is computed once.
     """
-    generator = SpellCircleGenerator()
-
-    # Create base elements first (without spell circles)
-    base_elements = [
-        Element(
-            name="Fire",
-            description="The primal force of heat and transformation. Fire consumes and purifies, turning matter into energy and ash. It represents passion, destruction, and rebirth.",
-            tags=["heat", "energy", "destructive", "transformative", "consuming"],
-            visual_hint="🔥",
-            behavior_hints=["spreads", "consumes", "radiates", "transforms"],
-            is_base=True
-        ),
-
-        Element(
-            name="Water",
-            description="The essence of flow and adaptation. Water shapes itself to any vessel, erodes the strongest stone, and carries life within its depths. It represents change, persistence, and emotion.",
-            tags=["fluid", "adaptive", "erosive", "life-giving", "flowing"],
-            visual_hint="💧",
-            behavior_hints=["flows", "adapts", "erodes", "conducts", "cleanses"],
-            is_base=True
-        ),
-
-        Element(
-            name="Earth",
-            description="The foundation of stability and growth. Earth endures through ages, provides shelter and sustenance, and holds ancient memory within its layers. It represents strength, permanence, and patience.",
-            tags=["solid", "stable", "enduring", "grounding", "fertile"],
-            visual_hint="🌍",
-            behavior_hints=["stabilizes", "grounds", "grows", "endures", "shields"],
-            is_base=True
-        ),
-
-        Element(
-            name="Air",
-            description="The breath of freedom and change. Air moves unseen but felt, carrying whispers and storms alike. It fills all empty spaces and cannot be grasped. It represents freedom, communication, and the intangible.",
-            tags=["gaseous", "invisible", "swift", "pervasive", "untethered"],
-            visual_hint="💨",
-            behavior_hints=["disperses", "carries", "accelerates", "fills", "evades"],
-            is_base=True
-        ),
-
-        Element(
-            name="Light",
-            description="The revelation that banishes shadow. Light exposes truth, brings warmth without consuming, and guides through darkness. It represents knowledge, hope, and clarity.",
-            tags=["radiant", "revealing", "pure", "illuminating", "warm"],
-            visual_hint="✨",
-            behavior_hints=["reveals", "illuminates", "purifies", "guides", "blinds"],
-            is_base=True
-        ),
-
-        Element(
-            name="Shadow",
-            description="The absence that defines presence. Shadow conceals and protects, holds secrets and fears, and exists only in relation to light. It represents mystery, the unknown, and hidden depths.",
-            tags=["dark", "concealing", "cold", "subtle", "elusive"],
-            visual_hint="🌑",
-            behavior_hints=["conceals", "obscures", "chills", "lingers", "whispers"],
-            is_base=True
-        ),
-
-        Element(
-            name="Chaos",
-            description="The primordial force of entropy and possibility. Chaos breaks patterns, defies prediction, and holds infinite potential in its randomness. It represents change, creativity, and raw power.",
-            tags=["unpredictable", "entropic", "wild", "potential", "volatile"],
-            visual_hint="🌀",
-            behavior_hints=["randomizes", "destabilizes", "mutates", "erupts", "warps"],
-            is_base=True
-        ),
-
-        Element(
-            name="Order",
-            description="The structure that emerges from chaos. Order creates patterns, establishes laws, and brings harmony through constraint. It represents control, predictability, and perfection.",
-            tags=["structured", "lawful", "harmonious", "controlled", "perfect"],
-            visual_hint="⚖️",  # Temporary, will be replaced with spell circle
-            behavior_hints=["structures", "constrains", "harmonizes", "calculates", "perfects"],
-            is_base=True
-        ),
-    ]
-
-    # Generate unique spell circles for each base element
-    for element in base_elements:
-        spell_circle_svg = generator.generate(element)
-        element.visual_hint = spell_circle_svg
-
-    return base_elements
+    return tuple(sys.intern(s) for s in strings)
+
+
+# The base element definitions live as one immutable tuple of specs,
+# interned at import time; building the set is just eight constructor
+# calls over shared constant data instead of re-allocating literals.
+_BASE_ELEMENT_SPECS: tuple[dict, ...] = (
+    {
+        "name": "Fire",
+        "description": "The primal force of heat and transformation. Fire consumes and purifies, turning matter into energy and ash. It represents passion, destruction, and rebirth.",
+        "tags": _interned("heat", "energy", "destructive", "transformative", "consuming"),
+        "visual_hint": "🔥",
+        "behavior_hints": _interned("spreads", "consumes", "radiates", "transforms"),
+    },
+    {
+        "name": "Water",
+        "description": "The essence of flow and adaptation. Water shapes itself to any vessel, erodes the strongest stone, and carries life within its depths. It represents change, persistence, and emotion.",
+        "tags": _interned("fluid", "adaptive", "erosive", "life-giving", "flowing"),
+        "visual_hint": "💧",
+        "behavior_hints": _interned("flows", "adapts", "erodes", "conducts", "cleanses"),
+    },
+    {
+        "name": "Earth",
+        "description": "The foundation of stability and growth. Earth endures through ages, provides shelter and sustenance, and holds ancient memory within its layers. It represents strength, permanence, and patience.",
+        "tags": _interned("solid", "stable", "enduring", "grounding", "fertile"),
+        "visual_hint": "🌍",
+        "behavior_hints": _interned("stabilizes", "grounds", "grows", "endures", "shields"),
+    },
+    {
+        "name": "Air",
+        "description": "The breath of freedom and change. Air moves unseen but felt, carrying whispers and storms alike. It fills all empty spaces and cannot be grasped. It represents freedom, communication, and the intangible.",
+        "tags": _interned("gaseous", "invisible", "swift", "pervasive", "untethered"),
+        "visual_hint": "💨",
+        "behavior_hints": _interned("disperses", "carries", "accelerates", "fills", "evades"),
+    },
+    {
+        "name": "Light",
+        "description": "The revelation that banishes shadow. Light exposes truth, brings warmth without consuming, and guides through darkness. It represents knowledge, hope, and clarity.",
+        "tags": _interned("radiant", "revealing", "pure", "illuminating", "warm"),
+        "visual_hint": "✨",
+        "behavior_hints": _interned("reveals", "illuminates", "purifies", "guides", "blinds"),
+    },
+    {
+        "name": "Shadow",
+        "description": "The absence that defines presence. Shadow conceals and protects, holds secrets and fears, and exists only in relation to light. It represents mystery, the unknown, and hidden depths.",
+        "tags": _interned("dark", "concealing", "cold", "subtle", "elusive"),
+        "visual_hint": "🌑",
+        "behavior_hints": _interned("conceals", "obscures", "chills", "lingers", "whispers"),
+    },
+    {
+        "name": "Chaos",
+        "description": "The primordial force of entropy and possibility. Chaos breaks patterns, defies prediction, and holds infinite potential in its randomness. It represents change, creativity, and raw power.",
+        "tags": _interned("unpredictable", "entropic", "wild", "potential", "volatile"),
+        "visual_hint": "🌀",
+        "behavior_hints": _interned("randomizes", "destabilizes", "mutates", "erupts", "warps"),
+    },
+    {
+        "name": "Order",
+        "description": "The structure that emerges from chaos. Order creates patterns, establishes laws, and brings harmony through constraint. It represents control, predictability, and perfection.",
+        "tags": _interned("structured", "lawful", "harmonious", "controlled", "perfect"),
+        "visual_hint": "⚖️",
+        "behavior_hints": _interned("structures", "constrains", "harmonizes", "calculates", "perfects"),
+    },
+)
 
 
 def initialize_base_elements(database):
@@ -104,16 +165,18 @@ def initialize_base_elements(database):
     Args:
         database: AlchemyDatabase instance
     """
-    existing_bases = database.get_base_elements()
+    # Cheap existence probe: the common already-seeded startup path
+    # shouldn't fetch and deserialize every base element just to count
+    if database.has_base_elements():
+        print("Found existing base elements.\n")
+        return
 
-    if len(existing_bases) == 0:
-        print("Initializing base elements...")
-        base_elements = get_base_elements()
+    print("Initializing base elements...")
+    base_elements = get_base_elements()
 
-        for element in base_elements:
-            database.save_element(element)
-            print(f"  ✓ Added: {element.name}")
+    # One transaction for the whole seed instead of a commit per row,
+    # and one summary line instead of a stdout flush per element
+    database.save_elements_bulk(base_elements)
+    print(f"  ✓ Added: {', '.join(element.name for element in base_elements)}")
 
-        print(f"\n{len(base_elements)} base elements initialized.\n")
-    else:
-        print(f"Found {len(existing_bases)} existing base elements.\n")
+    print(f"\n{len(base_elements)} base elements initialized.\n")
@@ -2,9 +2,15 @@
 Procedural spell circle generator for element icons.
 Generates unique, intricate SVG-based magical circles based on element properties.
 """
-import hashlib
 import math
+import sys
+import zlib
+from functools import lru_cache
+from itertools import cycle
 from typing import List, Tuple, Optional
+
+import numpy as np
+
 from .models import Element
 
 
@@ -25,84 +31,209 @@ class SpellCircleGenerator:
         "life-giving": "#44ff88", "transformative": "#ff8844",
     }
 
+    # Intern the hex codes once: the same few color strings are reused
+    # dozens of times per circle and feed the memoization keys, so
+    # sharing one object per code keeps hashing and comparisons cheap
+    TAG_COLORS = {k: sys.intern(v) for k, v in TAG_COLORS.items()}
+
+    # Frozen view of the color items for the substring fallback; tags
+    # that are exact TAG_COLORS tokens (the vast majority) resolve with
+    # one dict probe and never touch this
+    _TAG_COLOR_ITEMS = tuple(TAG_COLORS.items())
+
+    # Unit-circle (cos, sin) tables for the fixed N-fold symmetry
+    # loops — the angles never change, so the trig is paid once at
+    # class definition. The offset table serves the 30°-rotated inner
+    # hexagon in the earth pattern.
+    _UNIT_CIRCLE = {
+        n: tuple(
+            (math.cos(2 * math.pi * i / n), math.sin(2 * math.pi * i / n))
+            for i in range(n)
+        )
+        for n in (3, 4, 6, 8)
+    }
+    _UNIT_CIRCLE_HEX_30 = tuple(
+        (math.cos(math.radians(60 * i + 30)), math.sin(math.radians(60 * i + 30)))
+        for i in range(6)
+    )
+
+    # Prebuilt background-circle markup: only the radius, color, dash,
+    # and opacity slots vary per call
+    _BG_CIRCLE_TMPL = (
+        '<circle cx="{c:.1f}" cy="{c:.1f}" r="{r:.1f}" '
+        'fill="none" stroke="{col}" stroke-width="1.5"{dash} opacity="{op:.2f}"/>'
+    )
+
+    # Static document chrome between the title and the rotated group;
+    # shared verbatim by every composed SVG
+    _SVG_DEFS = '''  <defs>
+    <filter id="glow">
+      <feGaussianBlur stdDeviation="2.5" result="coloredBlur"/>
+      <feMerge>
+        <feMergeNode in="coloredBlur"/>
+        <feMergeNode in="SourceGraphic"/>
+      </feMerge>
+    </filter>
+    <filter id="innerGlow">
+      <feGaussianBlur stdDeviation="4" result="coloredBlur"/>
+      <feMerge>
+        <feMergeNode in="coloredBlur"/>
+        <feMergeNode in="coloredBlur"/>
+        <feMergeNode in="SourceGraphic"/>
+      </feMerge>
+    </filter>
+  </defs>
+  <g filter="url(#glow)" '''
+
     # Mystical runes (simplified alchemical/mystical symbols)
     RUNES = ["ᚠ", "ᚢ", "ᚦ", "ᚨ", "ᚱ", "ᚲ", "ᚷ", "ᚹ", "ᚺ", "ᚾ", "ᛁ", "ᛃ", "ᛇ", "ᛈ", "ᛉ", "ᛊ", "ᛏ", "ᛒ", "ᛖ", "ᛗ", "ᛚ", "ᛜ", "ᛞ", "ᛟ"]
 
     def __init__(self):
         self.size = 200
         self.center = self.size / 2
+        # Bound-method dispatch table: archetype resolution is one dict
+        # probe instead of walking an eight-way if/elif chain
+        self._pattern_dispatch = {
+            "fire": self._pattern_fire,
+            "water": self._pattern_water,
+            "earth": self._pattern_earth,
+            "air": self._pattern_air,
+            "light": self._pattern_light,
+            "shadow": self._pattern_shadow,
+            "chaos": self._pattern_chaos,
+            "order": self._pattern_order,
+        }
+        # Center sigil geometry is constant per archetype; only the
+        # color slot varies at generate time
+        self._center_templates = self._build_center_templates()
+        # Document opening up to the title text, fixed once the canvas
+        # size is known
+        self._svg_doc_head = (
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="0 0 {self.size} {self.size}" '
+            f'width="100%" height="100%">\n  <title>'
+        )
 
     def generate(self, element: Element, parent_a: Optional[Element] = None,
                  parent_b: Optional[Element] = None) -> str:
-        """Generate a unique, intricate spell circle SVG."""
-        seed = self._hash_to_seed(element.id)
-        colors = self._get_color_palette(element.tags, seed)
+        """
+        Generate a unique, intricate spell circle SVG.
+
+        The assembly itself runs on primitive fields pulled out of the
+        element (and its parents) up front; both paths are memoized on
+        those hashable primitives, so regenerating the circle for the
+        same inputs is a cache hit instead of a full SVG build.
+        """
+        if parent_a and parent_b:
+            return self._generate_with_parents(
+                element.id, element.name, tuple(element.tags),
+                tuple(element.behavior_hints),
+                tuple(parent_a.tags), tuple(parent_b.tags)
+            )
+        return self._generate_solo(
+            element.id, element.name, tuple(element.tags),
+            tuple(element.behavior_hints)
+        )
+
+    @lru_cache(maxsize=256)
+    def _generate_solo(self, element_id: str, name: str, tags: Tuple[str, ...],
+                       behavior_hints: Tuple[str, ...]) -> str:
+        """Memoized primitive-argument path for parentless circles."""
+        return self._generate_svg(element_id, name, tags, behavior_hints)
+
+    @lru_cache(maxsize=256)
+    def _generate_with_parents(self, element_id: str, name: str,
+                               tags: Tuple[str, ...],
+                               behavior_hints: Tuple[str, ...],
+                               parent_a_tags: Tuple[str, ...],
+                               parent_b_tags: Tuple[str, ...]) -> str:
+        """Memoized path for derived circles with parent blending."""
+        return self._generate_svg(element_id, name, tags, behavior_hints,
+                                  parent_a_tags, parent_b_tags)
+
+    def _generate_svg(self, element_id: str, name: str, tags: Tuple[str, ...],
+                      behavior_hints: Tuple[str, ...],
+                      parent_a_tags: Optional[Tuple[str, ...]] = None,
+                      parent_b_tags: Optional[Tuple[str, ...]] = None) -> str:
+        """Assemble the spell circle SVG from primitive element fields."""
+        seed = self._hash_to_seed(element_id)
+        colors = self._get_color_palette(tags, seed)
 
         # Determine element archetype for pattern selection
-        archetype = self._determine_archetype(element.tags)
+        archetype = self._determine_archetype(tags)
 
-        svg_parts = []
+        # Every emitter appends fragments into this one shared buffer;
+        # no per-section intermediate lists get built and re-extended
+        svg_parts: List[str] = []
 
         # Background layer (1-2 circles max, used sparingly)
-        svg_parts.extend(self._generate_background_circles(colors, seed, min(len(element.tags), 2)))
+        self._generate_background_circles(svg_parts, colors, seed, min(len(tags), 2))
 
         # Main geometric pattern based on archetype
-        svg_parts.extend(self._generate_sacred_geometry(archetype, colors, seed, element))
+        self._generate_sacred_geometry(svg_parts, archetype, colors, seed)
 
         # Runic symbols around perimeter
-        svg_parts.extend(self._generate_runes(element, colors, seed))
+        self._generate_runes(svg_parts, tags, behavior_hints, colors, seed)
 
         # Symbolic constellation connecting behavior hints
-        svg_parts.extend(self._generate_constellation(element.behavior_hints, colors, seed))
+        self._generate_constellation(svg_parts, behavior_hints, colors, seed)
 
-        # Parent integration (if derived element)
-        if parent_a and parent_b:
-            svg_parts.extend(self._generate_parent_blend(parent_a, parent_b, colors, seed))
+        # Parent integration (derived-element path only; the solo
+        # caller never passes parents, so this stays a no-op there)
+        if parent_a_tags and parent_b_tags:
+            self._generate_parent_blend(svg_parts, parent_a_tags, parent_b_tags,
+                                        colors, seed)
 
         # Complex center design
-        svg_parts.append(self._generate_center_sigil(archetype, colors[0], seed, element.name))
+        self._generate_center_sigil(svg_parts, archetype, colors[0], seed, name)
 
         # Apply rotation for some elements
         rotation = self._get_rotation(seed, archetype)
 
-        return self._compose_svg(svg_parts, element.name, rotation)
+        return self._compose_svg(svg_parts, name, rotation)
 
     def _hash_to_seed(self, element_id: str) -> int:
         """Convert element ID to deterministic seed."""
-        hash_obj = hashlib.md5(element_id.encode())
-        return int(hash_obj.hexdigest()[:8], 16)
+        # The seed only needs to be deterministic and well-spread, not
+        # cryptographic: crc32 is one C call returning a 32-bit int
+        # directly, with no digest allocation or hex parsing
+        return zlib.crc32(element_id.encode())
+
+    # Archetype keyword sets in precedence order: detection is a set
+    # intersection per archetype instead of nested list scans
+    _ARCHETYPE_SETS = (
+        ("fire", frozenset({"heat", "fire", "energy", "destructive"})),
+        ("water", frozenset({"fluid", "water", "flowing", "adaptive"})),
+        ("earth", frozenset({"solid", "earth", "stone", "stable"})),
+        ("air", frozenset({"gaseous", "air", "swift", "invisible"})),
+        ("light", frozenset({"radiant", "light", "illuminating"})),
+        ("shadow", frozenset({"dark", "shadow", "concealing"})),
+        ("chaos", frozenset({"entropic", "chaos", "wild", "volatile"})),
+        ("order", frozenset({"lawful", "order", "structured", "perfect"})),
+    )
 
     def _determine_archetype(self, tags: List[str]) -> str:
         """Determine element archetype from tags."""
-        tags_lower = [t.lower() for t in tags]
-
-        if any(t in tags_lower for t in ["heat", "fire", "energy", "destructive"]):
-            return "fire"
-        elif any(t in tags_lower for t in ["fluid", "water", "flowing", "adaptive"]):
-            return "water"
-        elif any(t in tags_lower for t in ["solid", "earth", "stone", "stable"]):
-            return "earth"
-        elif any(t in tags_lower for t in ["gaseous", "air", "swift", "invisible"]):
-            return "air"
-        elif any(t in tags_lower for t in ["radiant", "light", "illuminating"]):
-            return "light"
-        elif any(t in tags_lower for t in ["dark", "shadow", "concealing"]):
-            return "shadow"
-        elif any(t in tags_lower for t in ["entropic", "chaos", "wild", "volatile"]):
-            return "chaos"
-        elif any(t in tags_lower for t in ["lawful", "order", "structured", "perfect"]):
-            return "order"
-        else:
-            return "neutral"
+        tag_set = {t.lower() for t in tags}
+        for name, keywords in self._ARCHETYPE_SETS:
+            if tag_set & keywords:
+                return name
+        return "neutral"
 
     def _get_color_palette(self, tags: List[str], seed: int) -> List[str]:
         """Generate color palette from tags."""
         colors = []
+        tag_colors = self.TAG_COLORS
+        tag_items = self._TAG_COLOR_ITEMS
         for tag in tags:
-            for key, color in self.TAG_COLORS.items():
-                if key in tag.lower():
-                    colors.append(color)
-                    break
+            tag_lower = tag.lower()
+            # Exact token hit is one hash probe; only unknown tags fall
+            # back to the substring scan over the frozen items
+            color = tag_colors.get(tag_lower)
+            if color is None:
+                color = next((c for key, c in tag_items if key in tag_lower), None)
+            if color is not None:
+                colors.append(color)
 
         while len(colors) < 4:
             seed = (seed * 1103515245 + 12345) & 0x7fffffff
@@ -111,339 +242,310 @@ class SpellCircleGenerator:
 
         return colors[:6]
 
-    def _generate_background_circles(self, colors: List[str], seed: int, count: int) -> List[str]:
+    def _generate_background_circles(self, out: List[str], colors: List[str],
+                                     seed: int, count: int) -> None:
         """Generate 1-2 background circles as accent, not main structure."""
-        circles = []
-        max_radius = self.center * 0.95
+        c = self.center
+        max_radius = c * 0.95
+        tmpl = self._BG_CIRCLE_TMPL
 
         for i in range(min(count, 2)):  # Max 2 circles
-            radius = max_radius - (i * 25)
-            color = colors[i % len(colors)]
             seed = (seed * 1103515245 + 12345) & 0x7fffffff
-
-            opacity = 0.2 + (seed % 30) / 100
-            dash = ""
-            if seed % 2 == 0:
-                dash = f'stroke-dasharray="8 4"'
-
-            circles.append(
-                f'<circle cx="{self.center}" cy="{self.center}" r="{radius}" '
-                f'fill="none" stroke="{color}" stroke-width="1.5" {dash} opacity="{opacity}"/>'
-            )
-
-        return circles
-
-    def _generate_sacred_geometry(self, archetype: str, colors: List[str],
-                                   seed: int, element: Element) -> List[str]:
+            dash = ' stroke-dasharray="8 4"' if seed % 2 == 0 else ""
+            out.append(tmpl.format(
+                c=c,
+                r=max_radius - (i * 25),
+                col=colors[i % len(colors)],
+                dash=dash,
+                op=0.2 + (seed % 30) / 100,
+            ))
+
+    def _generate_sacred_geometry(self, out: List[str], archetype: str,
+                                   colors: List[str], seed: int) -> None:
         """Generate main geometric pattern based on element archetype."""
-        patterns = []
-
-        if archetype == "fire":
-            patterns.extend(self._pattern_fire(colors, seed))
-        elif archetype == "water":
-            patterns.extend(self._pattern_water(colors, seed))
-        elif archetype == "earth":
-            patterns.extend(self._pattern_earth(colors, seed))
-        elif archetype == "air":
-            patterns.extend(self._pattern_air(colors, seed))
-        elif archetype == "light":
-            patterns.extend(self._pattern_light(colors, seed))
-        elif archetype == "shadow":
-            patterns.extend(self._pattern_shadow(colors, seed))
-        elif archetype == "chaos":
-            patterns.extend(self._pattern_chaos(colors, seed))
-        elif archetype == "order":
-            patterns.extend(self._pattern_order(colors, seed))
-        else:
-            patterns.extend(self._pattern_neutral(colors, seed))
-
-        return patterns
+        self._pattern_dispatch.get(archetype, self._pattern_neutral)(out, colors, seed)
 
-    def _pattern_fire(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_fire(self, out: List[str], colors: List[str], seed: int) -> None:
         """Sharp triangular rays radiating outward."""
-        patterns = []
         ray_count = 8 + (seed % 5)
+        c = self.center
+        c0 = colors[0]
+        nc = len(colors)
+
+        # Inner and outer points for triangular rays
+        inner_r = c * 0.4
+        outer_r = c * 0.85
+        mid_r = (inner_r + outer_r) / 2
+        c15 = math.cos(math.radians(15))
+        s15 = math.sin(math.radians(15))
+
+        # One trig pass over the ray angles; the ±15° side points come
+        # from the angle-addition identities instead of four more
+        # cos/sin array evaluations
+        angles = np.arange(ray_count) * (2 * np.pi / ray_count)
+        cos_a = np.cos(angles)
+        sin_a = np.sin(angles)
+        x1s = (c + inner_r * cos_a).tolist()
+        y1s = (c + inner_r * sin_a).tolist()
+        x2s = (c + outer_r * cos_a).tolist()
+        y2s = (c + outer_r * sin_a).tolist()
+
+        # Side points for triangles: cos(a±15°) = cos a cos 15° ∓ sin a sin 15°
+        x3s = (c + mid_r * (cos_a * c15 - sin_a * s15)).tolist()
+        y3s = (c + mid_r * (sin_a * c15 + cos_a * s15)).tolist()
+        x4s = (c + mid_r * (cos_a * c15 + sin_a * s15)).tolist()
+        y4s = (c + mid_r * (sin_a * c15 - cos_a * s15)).tolist()
+
+        out.extend(
+            f'<path d="M {x1s[i]:.1f} {y1s[i]:.1f} L {x3s[i]:.1f} {y3s[i]:.1f} '
+            f'L {x2s[i]:.1f} {y2s[i]:.1f} L {x4s[i]:.1f} {y4s[i]:.1f} Z" '
+            f'fill="{colors[i % nc]}" opacity="0.6" stroke="{c0}" stroke-width="1"/>'
+            for i in range(ray_count)
+        )
 
-        for i in range(ray_count):
-            angle = (360 / ray_count) * i
-            angle_rad = math.radians(angle)
-
-            # Inner and outer points for triangular rays
-            inner_r = self.center * 0.4
-            outer_r = self.center * 0.85
-
-            x1 = self.center + inner_r * math.cos(angle_rad)
-            y1 = self.center + inner_r * math.sin(angle_rad)
-            x2 = self.center + outer_r * math.cos(angle_rad)
-            y2 = self.center + outer_r * math.sin(angle_rad)
-
-            # Side points for triangle
-            side_angle = 15
-            x3 = self.center + (inner_r + outer_r) / 2 * math.cos(math.radians(angle + side_angle))
-            y3 = self.center + (inner_r + outer_r) / 2 * math.sin(math.radians(angle + side_angle))
-            x4 = self.center + (inner_r + outer_r) / 2 * math.cos(math.radians(angle - side_angle))
-            y4 = self.center + (inner_r + outer_r) / 2 * math.sin(math.radians(angle - side_angle))
-
-            color = colors[i % len(colors)]
-            patterns.append(
-                f'<path d="M {x1} {y1} L {x3} {y3} L {x2} {y2} L {x4} {y4} Z" '
-                f'fill="{color}" opacity="0.6" stroke="{colors[0]}" stroke-width="1"/>'
-            )
-
-        return patterns
-
-    def _pattern_water(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_water(self, out: List[str], colors: List[str], seed: int) -> None:
         """Flowing curves and wave patterns."""
-        patterns = []
         wave_count = 6
+        amplitude = 5 + (seed % 10)
+        c = self.center
+        nc = len(colors)
+
+        # The 36 sample angles (and the tripled-frequency wave term)
+        # are the same for every ring — compute the trig once
+        angles = np.arange(36) * (np.pi / 18)
+        waves = amplitude * np.sin(3 * angles)
+        cos_a = np.cos(angles)
+        sin_a = np.sin(angles)
 
         for i in range(wave_count):
-            radius = self.center * (0.3 + i * 0.1)
-            amplitude = 5 + (seed % 10)
+            radius = c * (0.3 + i * 0.1)
 
             # Create flowing sine wave path
-            path = f"M {self.center + radius} {self.center}"
-            for angle in range(0, 360, 10):
-                angle_rad = math.radians(angle)
-                wave = amplitude * math.sin(math.radians(angle * 3))
-                r = radius + wave
-                x = self.center + r * math.cos(angle_rad)
-                y = self.center + r * math.sin(angle_rad)
-                path += f" L {x} {y}"
-            path += " Z"
-
-            color = colors[i % len(colors)]
-            patterns.append(
+            r = radius + waves
+            xs = (c + r * cos_a).tolist()
+            ys = (c + r * sin_a).tolist()
+            points = " L ".join(f"{x:.1f} {y:.1f}" for x, y in zip(xs, ys))
+            path = f"M {c + radius:.1f} {c:.1f} L {points} Z"
+
+            color = colors[i % nc]
+            out.append(
                 f'<path d="{path}" fill="none" stroke="{color}" '
                 f'stroke-width="2" opacity="0.65"/>'
             )
 
-        return patterns
-
-    def _pattern_earth(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_earth(self, out: List[str], colors: List[str], seed: int) -> None:
         """Crystalline hexagonal grid structure."""
-        patterns = []
+        c = self.center
+        c0 = colors[0]
+        spoke_color = colors[1 % len(colors)]
 
         # Generate hexagon
-        hex_points = []
-        hex_radius = self.center * 0.7
-        for i in range(6):
-            angle = math.radians(60 * i)
-            x = self.center + hex_radius * math.cos(angle)
-            y = self.center + hex_radius * math.sin(angle)
-            hex_points.append((x, y))
+        hex_radius = c * 0.7
+        hex_points = [
+            (c + hex_radius * ux, c + hex_radius * uy)
+            for ux, uy in self._UNIT_CIRCLE[6]
+        ]
 
         # Main hexagon
-        hex_path = "M " + " L ".join([f"{x} {y}" for x, y in hex_points]) + " Z"
-        patterns.append(
-            f'<path d="{hex_path}" fill="none" stroke="{colors[0]}" '
+        hex_path = "M " + " L ".join([f"{x:.1f} {y:.1f}" for x, y in hex_points]) + " Z"
+        out.append(
+            f'<path d="{hex_path}" fill="none" stroke="{c0}" '
             f'stroke-width="2" opacity="0.7"/>'
         )
 
         # Inner geometric divisions
-        for i in range(6):
-            x, y = hex_points[i]
-            patterns.append(
-                f'<line x1="{self.center}" y1="{self.center}" x2="{x}" y2="{y}" '
-                f'stroke="{colors[1 % len(colors)]}" stroke-width="1" opacity="0.6"/>'
+        for x, y in hex_points:
+            out.append(
+                f'<line x1="{c:.1f}" y1="{c:.1f}" x2="{x:.1f}" y2="{y:.1f}" '
+                f'stroke="{spoke_color}" stroke-width="1" opacity="0.6"/>'
             )
 
         # Smaller inner hexagon
-        small_hex_radius = self.center * 0.35
-        small_hex = []
-        for i in range(6):
-            angle = math.radians(60 * i + 30)
-            x = self.center + small_hex_radius * math.cos(angle)
-            y = self.center + small_hex_radius * math.sin(angle)
-            small_hex.append((x, y))
-
-        small_path = "M " + " L ".join([f"{x} {y}" for x, y in small_hex]) + " Z"
-        patterns.append(
-            f'<path d="{small_path}" fill="{colors[0]}" opacity="0.2" '
-            f'stroke="{colors[1 % len(colors)]}" stroke-width="1.5"/>'
+        small_hex_radius = c * 0.35
+        small_hex = [
+            (c + small_hex_radius * ux, c + small_hex_radius * uy)
+            for ux, uy in self._UNIT_CIRCLE_HEX_30
+        ]
+
+        small_path = "M " + " L ".join([f"{x:.1f} {y:.1f}" for x, y in small_hex]) + " Z"
+        out.append(
+            f'<path d="{small_path}" fill="{c0}" opacity="0.2" '
+            f'stroke="{spoke_color}" stroke-width="1.5"/>'
         )
 
-        return patterns
-
-    def _pattern_air(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_air(self, out: List[str], colors: List[str], seed: int) -> None:
         """Swirling spirals and curved lines."""
-        patterns = []
         spiral_count = 3
+        turns = 2 + (seed % 3)
+        c = self.center
+        nc = len(colors)
+
+        # Sample every 5 degrees along the spiral; one vectorized pass
+        # replaces the old loop over every single degree (which threw
+        # away four of every five points it computed)
+        steps = np.arange(0, 360 * turns, 5)
+        angles = np.radians(steps)
+        radii = (steps / (360 * turns)) * c * 0.8
+        head = f"M {c:.1f} {c:.1f} L "
 
         for s in range(spiral_count):
-            path = f"M {self.center} {self.center}"
-            turns = 2 + (seed % 3)
-
-            for i in range(360 * turns):
-                angle = math.radians(i)
-                radius = (i / (360 * turns)) * self.center * 0.8
-                x = self.center + radius * math.cos(angle + s * math.pi * 2 / spiral_count)
-                y = self.center + radius * math.sin(angle + s * math.pi * 2 / spiral_count)
-
-                if i % 5 == 0:  # Sample points
-                    path += f" L {x} {y}"
-
-            color = colors[s % len(colors)]
-            patterns.append(
+            phase = s * math.pi * 2 / spiral_count
+            xs = (c + radii * np.cos(angles + phase)).tolist()
+            ys = (c + radii * np.sin(angles + phase)).tolist()
+            points = " L ".join(f"{x:.1f} {y:.1f}" for x, y in zip(xs, ys))
+            path = head + points
+
+            color = colors[s % nc]
+            out.append(
                 f'<path d="{path}" fill="none" stroke="{color}" '
                 f'stroke-width="1.5" opacity="0.6"/>'
             )
 
-        return patterns
-
-    def _pattern_light(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_light(self, out: List[str], colors: List[str], seed: int) -> None:
         """Radiating beams and sunburst pattern."""
-        patterns = []
         beam_count = 12 + (seed % 8)
+        c = self.center
+        c0 = colors[0]
+        inner_r = c * 0.2
+
+        idx = np.arange(beam_count)
+        angles = idx * (2 * np.pi / beam_count)
+        cos_a = np.cos(angles)
+        sin_a = np.sin(angles)
+
+        # Alternating long and short beams
+        outer_r = np.where(idx % 2 == 0, c * 0.9, c * 0.7)
+
+        x1s = (c + inner_r * cos_a).tolist()
+        y1s = (c + inner_r * sin_a).tolist()
+        x2s = (c + outer_r * cos_a).tolist()
+        y2s = (c + outer_r * sin_a).tolist()
+
+        # Create gradient-like effect with opacity
+        out.extend(
+            f'<line x1="{x1s[i]:.1f}" y1="{y1s[i]:.1f}" x2="{x2s[i]:.1f}" y2="{y2s[i]:.1f}" '
+            f'stroke="{c0}" stroke-width="2" opacity="{0.3 + (i % 5) * 0.1}" '
+            f'stroke-linecap="round"/>'
+            for i in range(beam_count)
+        )
 
-        for i in range(beam_count):
-            angle = (360 / beam_count) * i
-            angle_rad = math.radians(angle)
-
-            # Alternating long and short beams
-            if i % 2 == 0:
-                outer_r = self.center * 0.9
-            else:
-                outer_r = self.center * 0.7
-
-            inner_r = self.center * 0.2
-
-            x1 = self.center + inner_r * math.cos(angle_rad)
-            y1 = self.center + inner_r * math.sin(angle_rad)
-            x2 = self.center + outer_r * math.cos(angle_rad)
-            y2 = self.center + outer_r * math.sin(angle_rad)
-
-            # Create gradient-like effect with opacity
-            opacity = 0.3 + (i % 5) * 0.1
-            patterns.append(
-                f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-                f'stroke="{colors[0]}" stroke-width="2" opacity="{opacity}" '
-                f'stroke-linecap="round"/>'
-            )
-
-        return patterns
-
-    def _pattern_shadow(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_shadow(self, out: List[str], colors: List[str], seed: int) -> None:
         """Interlocking crescents and void patterns."""
-        patterns = []
         crescent_count = 6
+        c = self.center
+        nc = len(colors)
 
-        for i in range(crescent_count):
-            angle = (360 / crescent_count) * i
-            radius = self.center * 0.6
-
+        radius = c * 0.6
+        offset_r = radius * 0.3
+        crescent_r = radius * 0.4
+        for i, (ux, uy) in enumerate(self._UNIT_CIRCLE[crescent_count]):
             # Create crescent using two circles (one filled, one cut out)
-            angle_rad = math.radians(angle)
-            x = self.center + radius * 0.3 * math.cos(angle_rad)
-            y = self.center + radius * 0.3 * math.sin(angle_rad)
+            x = c + offset_r * ux
+            y = c + offset_r * uy
 
-            patterns.append(
-                f'<circle cx="{x}" cy="{y}" r="{radius * 0.4}" '
-                f'fill="{colors[i % len(colors)]}" opacity="0.4"/>'
+            out.append(
+                f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{crescent_r:.1f}" '
+                f'fill="{colors[i % nc]}" opacity="0.4"/>'
             )
 
         # Add shadow voids (darker circles)
-        for i in range(3):
-            angle = i * 120
-            angle_rad = math.radians(angle)
-            x = self.center + self.center * 0.5 * math.cos(angle_rad)
-            y = self.center + self.center * 0.5 * math.sin(angle_rad)
-
-            patterns.append(
-                f'<circle cx="{x}" cy="{y}" r="15" '
+        void_radius = c * 0.5
+        for ux, uy in self._UNIT_CIRCLE[3]:
+            x = c + void_radius * ux
+            y = c + void_radius * uy
+
+            out.append(
+                f'<circle cx="{x:.1f}" cy="{y:.1f}" r="15" '
                 f'fill="#000000" opacity="0.3"/>'
             )
 
-        return patterns
-
-    def _pattern_chaos(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_chaos(self, out: List[str], colors: List[str], seed: int) -> None:
         """Asymmetric, broken geometry with jagged patterns."""
-        patterns = []
+        c = self.center
+        nc = len(colors)
+
+        # Draw all the pseudo-randoms for the eight shapes up front
+        # from one seeded generator instead of stepping an LCG and
+        # re-deriving moduli inside the loop
+        rng = np.random.default_rng(seed)
+        sides_arr = rng.integers(3, 8, size=8)
+        offsets = rng.integers(-30, 30, size=8) * (math.pi / 180)
+        radii = c * (0.4 + rng.integers(0, 400, size=8) / 1000)
+        widths = rng.integers(1, 3, size=8)
 
         # Create intentionally chaotic, asymmetric shapes
         for i in range(8):
-            seed = (seed * 1103515245 + 12345) & 0x7fffffff
-
-            # Random polygon
-            sides = 3 + (seed % 5)
-            path = "M "
-
-            for j in range(sides):
-                angle = math.radians((360 / sides) * j + (seed % 60) - 30)
-                radius = self.center * (0.4 + (seed % 400) / 1000)
-                x = self.center + radius * math.cos(angle)
-                y = self.center + radius * math.sin(angle)
-                path += f"{x} {y} L "
-
-            path += "Z"
+            sides = sides_arr[i]
+            angles = np.arange(sides) * (2 * np.pi / sides) + offsets[i]
+            xs = (c + radii[i] * np.cos(angles)).tolist()
+            ys = (c + radii[i] * np.sin(angles)).tolist()
+            path = (
+                "M "
+                + "".join(f"{x:.1f} {y:.1f} L " for x, y in zip(xs, ys))
+                + "Z"
+            )
 
-            color = colors[i % len(colors)]
-            patterns.append(
+            color = colors[i % nc]
+            out.append(
                 f'<path d="{path}" fill="none" stroke="{color}" '
-                f'stroke-width="{1 + seed % 2}" opacity="0.5"/>'
+                f'stroke-width="{widths[i]}" opacity="0.5"/>'
             )
 
-        return patterns
-
-    def _pattern_order(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_order(self, out: List[str], colors: List[str], seed: int) -> None:
         """Perfect symmetry, mandala-like precision."""
-        patterns = []
-
         # Create perfect mandala with 8-fold symmetry
         symmetry = 8
         layers = 4
+        c = self.center
+        c0 = colors[0]
+        nc = len(colors)
+        line_color = colors[1 % nc]
 
         for layer in range(layers):
-            radius = self.center * (0.3 + layer * 0.15)
-
-            for i in range(symmetry):
-                angle = (360 / symmetry) * i
-                angle_rad = math.radians(angle)
+            radius = c * (0.3 + layer * 0.15)
+            prev_radius = c * (0.3 + (layer - 1) * 0.15)
+            fill = colors[layer % nc]
 
+            for ux, uy in self._UNIT_CIRCLE[symmetry]:
                 # Perfect geometric shapes at each point
-                x = self.center + radius * math.cos(angle_rad)
-                y = self.center + radius * math.sin(angle_rad)
+                x = c + radius * ux
+                y = c + radius * uy
 
                 # Small perfect circles at symmetry points
-                patterns.append(
-                    f'<circle cx="{x}" cy="{y}" r="6" '
-                    f'fill="{colors[layer % len(colors)]}" opacity="0.7" '
-                    f'stroke="{colors[0]}" stroke-width="1"/>'
+                out.append(
+                    f'<circle cx="{x:.1f}" cy="{y:.1f}" r="6" '
+                    f'fill="{fill}" opacity="0.7" '
+                    f'stroke="{c0}" stroke-width="1"/>'
                 )
 
                 # Connect with perfect lines
                 if layer > 0:
-                    prev_radius = self.center * (0.3 + (layer - 1) * 0.15)
-                    prev_x = self.center + prev_radius * math.cos(angle_rad)
-                    prev_y = self.center + prev_radius * math.sin(angle_rad)
+                    prev_x = c + prev_radius * ux
+                    prev_y = c + prev_radius * uy
 
-                    patterns.append(
-                        f'<line x1="{prev_x}" y1="{prev_y}" x2="{x}" y2="{y}" '
-                        f'stroke="{colors[1 % len(colors)]}" stroke-width="1" opacity="0.55"/>'
+                    out.append(
+                        f'<line x1="{prev_x:.1f}" y1="{prev_y:.1f}" x2="{x:.1f}" y2="{y:.1f}" '
+                        f'stroke="{line_color}" stroke-width="1" opacity="0.55"/>'
                     )
 
-        return patterns
-
-    def _pattern_neutral(self, colors: List[str], seed: int) -> List[str]:
+    def _pattern_neutral(self, out: List[str], colors: List[str], seed: int) -> None:
         """Varied geometric patterns for neutral/hybrid elements."""
-        patterns = []
-
         # Choose from several different patterns based on seed
         pattern_type = seed % 5
 
         if pattern_type == 0:
             # Interlocking triangles
             size = self.center * 0.6
-            patterns.append(
-                f'<path d="M {self.center} {self.center - size} '
-                f'L {self.center - size} {self.center + size} '
-                f'L {self.center + size} {self.center + size} Z" '
+            out.append(
+                f'<path d="M {self.center:.1f} {self.center - size:.1f} '
+                f'L {self.center - size:.1f} {self.center + size:.1f} '
+                f'L {self.center + size:.1f} {self.center + size:.1f} Z" '
                 f'fill="none" stroke="{colors[0]}" stroke-width="2" opacity="0.6"/>'
             )
-            patterns.append(
-                f'<path d="M {self.center} {self.center + size * 0.6} '
-                f'L {self.center - size * 0.6} {self.center - size * 0.6} '
-                f'L {self.center + size * 0.6} {self.center - size * 0.6} Z" '
+            out.append(
+                f'<path d="M {self.center:.1f} {self.center + size * 0.6:.1f} '
+                f'L {self.center - size * 0.6:.1f} {self.center - size * 0.6:.1f} '
+                f'L {self.center + size * 0.6:.1f} {self.center - size * 0.6:.1f} Z" '
                 f'fill="none" stroke="{colors[1 % len(colors)]}" stroke-width="2" opacity="0.6"/>'
             )
         elif pattern_type == 1:
@@ -451,53 +553,51 @@ class SpellCircleGenerator:
             for i in range(3):
                 size = self.center * (0.3 + i * 0.15)
                 rotation = 45 if i % 2 else 0
-                patterns.append(
-                    f'<rect x="{self.center - size}" y="{self.center - size}" '
-                    f'width="{size * 2}" height="{size * 2}" fill="none" '
+                out.append(
+                    f'<rect x="{self.center - size:.1f}" y="{self.center - size:.1f}" '
+                    f'width="{size * 2:.1f}" height="{size * 2:.1f}" fill="none" '
                     f'stroke="{colors[i % len(colors)]}" stroke-width="1.5" opacity="0.5" '
-                    f'transform="rotate({rotation} {self.center} {self.center})"/>'
+                    f'transform="rotate({rotation} {self.center:.1f} {self.center:.1f})"/>'
                 )
         elif pattern_type == 2:
             # Cross pattern with diamonds
             length = self.center * 0.7
-            patterns.append(
-                f'<line x1="{self.center}" y1="{self.center - length}" '
-                f'x2="{self.center}" y2="{self.center + length}" '
+            out.append(
+                f'<line x1="{self.center:.1f}" y1="{self.center - length:.1f}" '
+                f'x2="{self.center:.1f}" y2="{self.center + length:.1f}" '
                 f'stroke="{colors[0]}" stroke-width="2" opacity="0.6"/>'
             )
-            patterns.append(
-                f'<line x1="{self.center - length}" y1="{self.center}" '
-                f'x2="{self.center + length}" y2="{self.center}" '
+            out.append(
+                f'<line x1="{self.center - length:.1f}" y1="{self.center:.1f}" '
+                f'x2="{self.center + length:.1f}" y2="{self.center:.1f}" '
                 f'stroke="{colors[1 % len(colors)]}" stroke-width="2" opacity="0.6"/>'
             )
             # Diamonds at ends
             diamond_size = 8
-            for angle in [0, 90, 180, 270]:
-                angle_rad = math.radians(angle)
-                x = self.center + length * math.cos(angle_rad)
-                y = self.center + length * math.sin(angle_rad)
-                patterns.append(
-                    f'<rect x="{x - diamond_size}" y="{y - diamond_size}" '
+            for ux, uy in self._UNIT_CIRCLE[4]:
+                x = self.center + length * ux
+                y = self.center + length * uy
+                out.append(
+                    f'<rect x="{x - diamond_size:.1f}" y="{y - diamond_size:.1f}" '
                     f'width="{diamond_size * 2}" height="{diamond_size * 2}" fill="{colors[0]}" '
-                    f'opacity="0.5" transform="rotate(45 {x} {y})"/>'
+                    f'opacity="0.5" transform="rotate(45 {x:.1f} {y:.1f})"/>'
                 )
         elif pattern_type == 3:
             # Octagon with radial divisions
             sides = 8
             radius = self.center * 0.7
             oct_path = "M "
-            for i in range(sides):
-                angle = math.radians((360 / sides) * i)
-                x = self.center + radius * math.cos(angle)
-                y = self.center + radius * math.sin(angle)
-                oct_path += f"{x} {y} L "
+            for ux, uy in self._UNIT_CIRCLE[sides]:
+                x = self.center + radius * ux
+                y = self.center + radius * uy
+                oct_path += f"{x:.1f} {y:.1f} L "
                 # Radial lines
-                patterns.append(
-                    f'<line x1="{self.center}" y1="{self.center}" x2="{x}" y2="{y}" '
+                out.append(
+                    f'<line x1="{self.center:.1f}" y1="{self.center:.1f}" x2="{x:.1f}" y2="{y:.1f}" '
                     f'stroke="{colors[1 % len(colors)]}" stroke-width="1" opacity="0.55"/>'
                 )
             oct_path += "Z"
-            patterns.append(
+            out.append(
                 f'<path d="{oct_path}" fill="none" stroke="{colors[0]}" '
                 f'stroke-width="2" opacity="0.6"/>'
             )
@@ -505,206 +605,211 @@ class SpellCircleGenerator:
             # Vesica piscis (two overlapping circles)
             offset = self.center * 0.25
             radius = self.center * 0.6
-            patterns.append(
-                f'<circle cx="{self.center - offset}" cy="{self.center}" r="{radius}" '
+            out.append(
+                f'<circle cx="{self.center - offset:.1f}" cy="{self.center:.1f}" r="{radius:.1f}" '
                 f'fill="none" stroke="{colors[0]}" stroke-width="2" opacity="0.5"/>'
             )
-            patterns.append(
-                f'<circle cx="{self.center + offset}" cy="{self.center}" r="{radius}" '
+            out.append(
+                f'<circle cx="{self.center + offset:.1f}" cy="{self.center:.1f}" r="{radius:.1f}" '
                 f'fill="none" stroke="{colors[1 % len(colors)]}" stroke-width="2" opacity="0.5"/>'
             )
 
-        return patterns
-
-    def _generate_runes(self, element: Element, colors: List[str], seed: int) -> List[str]:
+    def _generate_runes(self, out: List[str], tags: Tuple[str, ...],
+                        behavior_hints: Tuple[str, ...],
+                        colors: List[str], seed: int) -> None:
         """Generate mystical runes around the perimeter."""
-        runes = []
-        rune_count = min(len(element.tags) + len(element.behavior_hints), 12)
+        rune_count = min(len(tags) + len(behavior_hints), 12)
 
         if rune_count == 0:
-            return runes
+            return
 
         rune_radius = self.center * 0.9
+        step = 2 * math.pi / rune_count
+        runes = self.RUNES
+        n_runes = len(runes)
+
+        # Pick the rune sequence and positions up front so the emit
+        # loop is a single zip with colors cycled, no per-rune modulo
+        rune_seq = [runes[(seed + i * 7) % n_runes] for i in range(rune_count)]
+        positions = [
+            (self.center + rune_radius * math.cos(step * i),
+             self.center + rune_radius * math.sin(step * i))
+            for i in range(rune_count)
+        ]
+
+        out.extend(
+            f'<text x="{x:.1f}" y="{y:.1f}" font-family="serif" font-size="14" '
+            f'fill="{color}" opacity="0.7" text-anchor="middle" '
+            f'dominant-baseline="middle">{rune}</text>'
+            for (x, y), rune, color in zip(positions, rune_seq, cycle(colors))
+        )
 
-        for i in range(rune_count):
-            angle = (360 / rune_count) * i
-            angle_rad = math.radians(angle)
-
-            x = self.center + rune_radius * math.cos(angle_rad)
-            y = self.center + rune_radius * math.sin(angle_rad)
-
-            # Select rune based on seed and index
-            rune_index = (seed + i * 7) % len(self.RUNES)
-            rune = self.RUNES[rune_index]
-
-            color = colors[i % len(colors)]
-
-            runes.append(
-                f'<text x="{x}" y="{y}" font-family="serif" font-size="14" '
-                f'fill="{color}" opacity="0.7" text-anchor="middle" '
-                f'dominant-baseline="middle">{rune}</text>'
-            )
-
-        return runes
-
-    def _generate_constellation(self, behavior_hints: List[str], colors: List[str], seed: int) -> List[str]:
+    def _generate_constellation(self, out: List[str], behavior_hints: List[str],
+                                colors: List[str], seed: int) -> None:
         """Create subtle constellation by connecting behavior symbols."""
-        constellation = []
         symbol_count = min(len(behavior_hints), 6)  # Reduced from 8
 
         if symbol_count < 3:  # Require at least 3 for variety
-            return constellation
+            return
 
         # Only add constellation 50% of the time based on seed
         if seed % 2 == 0:
-            return constellation
+            return
 
         symbol_radius = self.center * 0.55
-        points = []
-
-        # Place symbols (smaller and more subtle)
-        for i in range(symbol_count):
-            angle = (360 / symbol_count) * i + (seed % 45)
-            angle_rad = math.radians(angle)
-            x = self.center + symbol_radius * math.cos(angle_rad)
-            y = self.center + symbol_radius * math.sin(angle_rad)
-            points.append((x, y))
-
-            # Smaller, more subtle markers
-            color = colors[i % len(colors)]
-            constellation.append(
-                f'<circle cx="{x}" cy="{y}" r="2.5" fill="{color}" opacity="0.7"/>'
-            )
 
-        # Only connect to adjacent points (not full polygon)
-        # Create more varied connection patterns
-        for i in range(len(points)):
-            # Connect to next point only if it's not creating a regular polygon feel
-            if i < len(points) - 1 and seed % 3 != 0:  # Skip some connections
-                x1, y1 = points[i]
-                x2, y2 = points[i + 1]
-
-                constellation.append(
-                    f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-                    f'stroke="{colors[0]}" stroke-width="0.8" opacity="0.45" '
-                    f'stroke-dasharray="2 3"/>'
-                )
+        # One trig pass over the whole layout instead of per-point calls
+        angles = (
+            np.arange(symbol_count) * (2 * np.pi / symbol_count)
+            + (seed % 45) * (np.pi / 180)
+        )
+        xs = (self.center + symbol_radius * np.cos(angles)).tolist()
+        ys = (self.center + symbol_radius * np.sin(angles)).tolist()
 
-        return constellation
+        # Smaller, more subtle markers
+        out.extend(
+            f'<circle cx="{x:.1f}" cy="{y:.1f}" r="2.5" fill="{color}" opacity="0.7"/>'
+            for x, y, color in zip(xs, ys, cycle(colors))
+        )
 
-    def _generate_parent_blend(self, parent_a: Element, parent_b: Element,
-                                colors: List[str], seed: int) -> List[str]:
-        """Blend parent patterns into the design."""
-        blend = []
+        # Only connect adjacent points (not full polygon), skipping some
+        # seeds entirely to keep connection patterns varied
+        if seed % 3 != 0:
+            line_color = colors[0]
+            out.extend(
+                f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" '
+                f'stroke="{line_color}" stroke-width="0.8" opacity="0.45" '
+                f'stroke-dasharray="2 3"/>'
+                for x1, y1, x2, y2 in zip(xs, ys, xs[1:], ys[1:])
+            )
 
-        parent_a_color = self._get_primary_color_from_tags(parent_a.tags)
-        parent_b_color = self._get_primary_color_from_tags(parent_b.tags)
+    def _generate_parent_blend(self, out: List[str],
+                                parent_a_tags: Tuple[str, ...],
+                                parent_b_tags: Tuple[str, ...],
+                                colors: List[str], seed: int) -> None:
+        """Blend parent patterns into the design."""
+        parent_a_color = self._get_primary_color_from_tags(parent_a_tags)
+        parent_b_color = self._get_primary_color_from_tags(parent_b_tags)
 
         # Create vesica piscis (two overlapping circles) representing parent fusion
         offset = self.center * 0.15
 
         # Parent A circle (left)
-        blend.append(
-            f'<circle cx="{self.center - offset}" cy="{self.center}" r="25" '
+        out.append(
+            f'<circle cx="{self.center - offset:.1f}" cy="{self.center:.1f}" r="25" '
             f'fill="none" stroke="{parent_a_color}" stroke-width="2" opacity="0.4"/>'
         )
 
         # Parent B circle (right)
-        blend.append(
-            f'<circle cx="{self.center + offset}" cy="{self.center}" r="25" '
+        out.append(
+            f'<circle cx="{self.center + offset:.1f}" cy="{self.center:.1f}" r="25" '
             f'fill="none" stroke="{parent_b_color}" stroke-width="2" opacity="0.4"/>'
         )
 
         # Add parent symbols in quadrants
-        archetype_a = self._determine_archetype(parent_a.tags)
-        archetype_b = self._determine_archetype(parent_b.tags)
+        archetype_a = self._determine_archetype(parent_a_tags)
+        archetype_b = self._determine_archetype(parent_b_tags)
 
         # Small parent signature patterns in corners
-        blend.append(
-            f'<text x="{self.center - 70}" y="{self.center - 70}" '
+        out.append(
+            f'<text x="{self.center - 70:.1f}" y="{self.center - 70:.1f}" '
             f'font-family="serif" font-size="10" fill="{parent_a_color}" '
             f'opacity="0.5">{archetype_a[0].upper()}</text>'
         )
 
-        blend.append(
-            f'<text x="{self.center + 70}" y="{self.center + 70}" '
+        out.append(
+            f'<text x="{self.center + 70:.1f}" y="{self.center + 70:.1f}" '
             f'font-family="serif" font-size="10" fill="{parent_b_color}" '
             f'opacity="0.5">{archetype_b[0].upper()}</text>'
         )
 
-        return blend
-
     def _get_primary_color_from_tags(self, tags: List[str]) -> str:
         """Get primary color for tags."""
+        tag_colors = self.TAG_COLORS
+        tag_items = self._TAG_COLOR_ITEMS
         for tag in tags:
-            for key, color in self.TAG_COLORS.items():
-                if key in tag.lower():
-                    return color
+            tag_lower = tag.lower()
+            color = tag_colors.get(tag_lower)
+            if color is None:
+                color = next((c for key, c in tag_items if key in tag_lower), None)
+            if color is not None:
+                return color
         return "#888888"
 
-    def _generate_center_sigil(self, archetype: str, color: str, seed: int, name: str) -> str:
+    def _build_center_templates(self) -> dict:
+        """
+        Precompute the center sigil markup per archetype.
+
+        The geometry only depends on self.center, so each shape is laid
+        out once here and the per-call work in _generate_center_sigil
+        collapses to a single format() filling in the color.
+        """
+        c = self.center
+        templates = {}
+
+        # Fire: upward triangle
+        size = 12
+        templates["fire"] = (
+            f'<path d="M {c:.1f} {c - size:.1f} '
+            f'L {c - size:.1f} {c + size:.1f} '
+            f'L {c + size:.1f} {c + size:.1f} Z" '
+            'fill="{color}" opacity="0.8"/>'
+        )
+
+        # Water: downward triangle
+        templates["water"] = (
+            f'<path d="M {c:.1f} {c + size:.1f} '
+            f'L {c - size:.1f} {c - size:.1f} '
+            f'L {c + size:.1f} {c - size:.1f} Z" '
+            'fill="{color}" opacity="0.8"/>'
+        )
+
+        # Earth: square
+        size = 10
+        templates["earth"] = (
+            f'<rect x="{c - size:.1f}" y="{c - size:.1f}" '
+            f'width="{size * 2:.1f}" height="{size * 2:.1f}" '
+            'fill="{color}" opacity="0.8"/>'
+        )
+
+        # Air: circle
+        templates["air"] = (
+            f'<circle cx="{c:.1f}" cy="{c:.1f}" r="10" '
+            'fill="{color}" opacity="0.8"/>'
+        )
+
+        # Order: perfect hexagon
+        hex_size = 12
+        hex_path = "M "
+        for ux, uy in self._UNIT_CIRCLE[6]:
+            hex_path += f"{c + hex_size * ux:.1f} {c + hex_size * uy:.1f} L "
+        hex_path += "Z"
+        templates["order"] = (
+            f'<path d="{hex_path}" ' + 'fill="{color}" opacity="0.8"/>'
+        )
+
+        # Default: pentagram
+        points = 5
+        outer = 12
+        inner = 5
+        path = "M "
+        half_step = math.pi / points
+        for i in range(points * 2):
+            angle = half_step * i - math.pi / 2
+            r = outer if i % 2 == 0 else inner
+            path += f"{c + r * math.cos(angle):.1f} {c + r * math.sin(angle):.1f} L "
+        path += "Z"
+        templates["default"] = (
+            f'<path d="{path}" ' + 'fill="{color}" opacity="0.8"/>'
+        )
+
+        return templates
+
+    def _generate_center_sigil(self, out: List[str], archetype: str, color: str,
+                               seed: int, name: str) -> None:
         """Generate complex center design."""
-        center_parts = []
-
-        # Archetype-specific center symbol
-        if archetype == "fire":
-            # Upward triangle
-            size = 12
-            center_parts.append(
-                f'<path d="M {self.center} {self.center - size} '
-                f'L {self.center - size} {self.center + size} '
-                f'L {self.center + size} {self.center + size} Z" '
-                f'fill="{color}" opacity="0.8"/>'
-            )
-        elif archetype == "water":
-            # Downward triangle
-            size = 12
-            center_parts.append(
-                f'<path d="M {self.center} {self.center + size} '
-                f'L {self.center - size} {self.center - size} '
-                f'L {self.center + size} {self.center - size} Z" '
-                f'fill="{color}" opacity="0.8"/>'
-            )
-        elif archetype == "earth":
-            # Square
-            size = 10
-            center_parts.append(
-                f'<rect x="{self.center - size}" y="{self.center - size}" '
-                f'width="{size * 2}" height="{size * 2}" fill="{color}" opacity="0.8"/>'
-            )
-        elif archetype == "air":
-            # Circle
-            center_parts.append(
-                f'<circle cx="{self.center}" cy="{self.center}" r="10" '
-                f'fill="{color}" opacity="0.8"/>'
-            )
-        elif archetype == "order":
-            # Perfect hexagon
-            hex_size = 12
-            hex_path = "M "
-            for i in range(6):
-                angle = math.radians(60 * i)
-                x = self.center + hex_size * math.cos(angle)
-                y = self.center + hex_size * math.sin(angle)
-                hex_path += f"{x} {y} L "
-            hex_path += "Z"
-            center_parts.append(f'<path d="{hex_path}" fill="{color}" opacity="0.8"/>')
-        else:
-            # Default: pentagram
-            points = 5
-            outer = 12
-            inner = 5
-            path = "M "
-            for i in range(points * 2):
-                angle = math.radians(i * 180 / points - 90)
-                r = outer if i % 2 == 0 else inner
-                x = self.center + r * math.cos(angle)
-                y = self.center + r * math.sin(angle)
-                path += f"{x} {y} L "
-            path += "Z"
-            center_parts.append(f'<path d="{path}" fill="{color}" opacity="0.8"/>')
-
-        return "\n  ".join(center_parts)
+        tmpl = self._center_templates.get(archetype, self._center_templates["default"])
+        out.append(tmpl.format(color=color))
 
     def _get_rotation(self, seed: int, archetype: str) -> float:
         """Determine rotation angle based on archetype."""
@@ -717,30 +822,17 @@ class SpellCircleGenerator:
 
     def _compose_svg(self, parts: List[str], element_name: str, rotation: float) -> str:
         """Compose final SVG with all enhancements."""
-        svg_content = "\n    ".join(parts)
-
-        transform = f'transform="rotate({rotation} {self.center} {self.center})"' if rotation != 0 else ''
-
-        return f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {self.size} {self.size}" width="100%" height="100%">
-  <title>{element_name} Spell Circle</title>
-  <defs>
-    <filter id="glow">
-      <feGaussianBlur stdDeviation="2.5" result="coloredBlur"/>
-      <feMerge>
-        <feMergeNode in="coloredBlur"/>
-        <feMergeNode in="SourceGraphic"/>
-      </feMerge>
-    </filter>
-    <filter id="innerGlow">
-      <feGaussianBlur stdDeviation="4" result="coloredBlur"/>
-      <feMerge>
-        <feMergeNode in="coloredBlur"/>
-        <feMergeNode in="coloredBlur"/>
-        <feMergeNode in="SourceGraphic"/>
-      </feMerge>
-    </filter>
-  </defs>
-  <g filter="url(#glow)" {transform}>
-    {svg_content}
-  </g>
-</svg>'''
+        transform = f'transform="rotate({rotation} {self.center:.1f} {self.center:.1f})"' if rotation != 0 else ''
+
+        # One flat join over precomputed document chrome: the old
+        # f-string re-copied the entire joined body a second time
+        return "".join((
+            self._svg_doc_head,
+            element_name,
+            " Spell Circle</title>\n",
+            self._SVG_DEFS,
+            transform,
+            ">\n    ",
+            "\n    ".join(parts),
+            "\n  </g>\n</svg>",
+        ))